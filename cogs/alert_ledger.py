@@ -0,0 +1,65 @@
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+import logging
+
+logger = logging.getLogger('tetsuo_bot.alert_ledger')
+
+class AlertLedger:
+    """On-disk record of every alert message the bot posted, indexed by send time
+
+    Methods are blocking; call them through asyncio.to_thread from the cogs."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.created = not self.path.exists()
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(self.path, check_same_thread=False)
+        with self.lock, self.db:
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS alerts ("
+                "message_id INTEGER PRIMARY KEY, channel_id INTEGER NOT NULL, sent_at REAL NOT NULL)"
+            )
+            self.db.execute("CREATE INDEX IF NOT EXISTS alerts_sent_at ON alerts (sent_at)")
+
+    def record(self, channel_id: int, message_id: int, sent_at: float):
+        with self.lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO alerts (message_id, channel_id, sent_at) VALUES (?, ?, ?)",
+                (message_id, channel_id, sent_at)
+            )
+
+    def record_many(self, rows: List[Tuple[int, int, float]]):
+        """Bulk insert of (channel_id, message_id, sent_at)"""
+        with self.lock, self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO alerts (channel_id, message_id, sent_at) VALUES (?, ?, ?)",
+                rows
+            )
+
+    def oldest(self) -> Optional[float]:
+        """Send time of the oldest alert still on record"""
+        with self.lock:
+            row = self.db.execute("SELECT MIN(sent_at) FROM alerts").fetchone()
+        return row[0] if row else None
+
+    def expired(self, before: float, limit: int = 500) -> List[Tuple[int, int, float]]:
+        """(channel_id, message_id, sent_at) of alerts sent before `before`, oldest first"""
+        with self.lock:
+            return self.db.execute(
+                "SELECT channel_id, message_id, sent_at FROM alerts WHERE sent_at < ? ORDER BY sent_at LIMIT ?",
+                (before, limit)
+            ).fetchall()
+
+    def remove(self, message_ids: List[int]):
+        with self.lock, self.db:
+            self.db.executemany("DELETE FROM alerts WHERE message_id = ?", [(message_id,) for message_id in message_ids])
+
+    def count(self) -> int:
+        with self.lock:
+            return self.db.execute("SELECT COUNT(*) FROM alerts").fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.db.close()
@@ -1,6 +1,10 @@
 import discord
 from discord.ext import commands
 import os
+import logging
+from .charts import get_sparkline_renderer
+
+logger = logging.getLogger('tetsuo_bot.base_raid')
 
 class BaseRaid(commands.Cog):
     def __init__(self, bot):
@@ -9,6 +13,8 @@ class BaseRaid(commands.Cog):
         self.engagement_targets = {}
         self.raid_channel_id = int(os.getenv('RAID_CHANNEL_ID', 0)) or None
         self.raid_mention = "<@&1316080159488606278>" # @everyone or <@&roleidnumber>
+        self.charts = get_sparkline_renderer()
+        self.max_raid_samples = 120
 
     async def check_raid_channel(self, ctx):
         """Check if the command is being used in the designated raid channel"""
@@ -24,12 +30,53 @@ class BaseRaid(commands.Cog):
             
         return True
 
+    def channel_has_raid(self, channel_id):
+        """Check every raid cog, not just this one, for an active raid in the channel"""
+        return any(
+            channel_id in cog.locked_channels
+            for cog in self.bot.cogs.values()
+            if isinstance(cog, BaseRaid)
+        )
+
+    def reserve_channel(self, channel_id) -> bool:
+        """Claim a channel for a new raid before any await, so two starts can't both pass the check"""
+        if self.channel_has_raid(channel_id):
+            return False
+        self.locked_channels[channel_id] = True
+        return True
+
+    def release_channel(self, channel_id):
+        """Drop a reservation for a raid that failed before the channel was locked"""
+        self.locked_channels.pop(channel_id, None)
+        self.engagement_targets.pop(channel_id, None)
+
     def create_progress_bar(self, current, target, length=20):
         """Create a visual progress bar"""
         percentage = min(current/target if target > 0 else 0, 1)
         filled = int(length * percentage)
         return f"[{'='*filled}{'-'*(length-filled)}]"
 
+    def record_sample(self, samples, value):
+        """Append a polled value to a raid's bounded sample list"""
+        samples.append(value)
+        del samples[:-self.max_raid_samples]
+
+    async def attach_sparkline(self, embed, rows, filename="raid_progress.png"):
+        """Render rows of (values, target, color) and point the embed's image at them
+
+        Returns the files to send with the message; empty if there is nothing to
+        plot yet or rendering failed."""
+        rows = [row for row in rows if len(row[0]) > 1]
+        if not rows:
+            return []
+        try:
+            file = await self.charts.render_file(rows, filename=filename)
+        except Exception as e:
+            logger.warning(f"Error rendering raid sparkline: {e}")
+            return []
+        embed.set_image(url=f"attachment://{filename}")
+        return [file]
+
     async def lock_channel(self, channel):
         """Lock a channel from user messages"""
         overwrites = channel.overwrites_for(channel.guild.default_role)
@@ -3,8 +3,13 @@ from discord.ext import commands
 import os
 from dotenv import load_dotenv
 import asyncio
+import heapq
+import time
 from datetime import datetime, timezone, timedelta
 import logging
+from .request_budget import get_request_budget
+from .message_registry import get_message_registry
+from .charts import PALETTE, get_sparkline_renderer
 logger = logging.getLogger('tetsuo_bot.channel_manager')
 
 class ChannelManager(commands.Cog):
@@ -12,15 +17,26 @@ class ChannelManager(commands.Cog):
         self.bot = bot
         self.raid_channel_id = int(os.getenv('RAID_CHANNEL_ID', 0)) or None
         self.last_metrics_update = None
-        self.metrics_message_id = None
-        self.previous_metrics = {
-            'cmc_likes': None,
-            'gecko_sentiment': None
-        }
+        self.max_token_pages = 5  # Discord caps a message at 10 embeds / 6000 characters
+        self.metrics_interval = 300
+        self.metrics_max_stretch = 4  # Dashboard refreshes slow to this multiple as the sentiment quota runs out
         self.cleanup_task = None
         self.metrics_task = None
+        self.message_ttl = 15 * 60  # Unpinned messages are removed after 15 minutes
+        self.cleanup_watermark = None  # ID of the newest message already scheduled or deleted
+        self.pinned_ids = {}  # channel ID -> pinned message IDs, refreshed on pins updates
+        self.expiry_heap = []  # (expires_at, message_id) min-heap
+        self.scheduled_ids = set()
+        self.expiry_wakeup = asyncio.Event()
+        self.reap_coalesce_seconds = 5
+        self.last_cleanup_stats = None
+        self.budget = get_request_budget()
+        self.registry = get_message_registry()
+        self.charts = get_sparkline_renderer()
 
     async def cleanup_messages(self):
+        """Reap raid channel messages as their expiry timers fire"""
+        caught_up_channel = None
         while True:
             try:
                 if not self.raid_channel_id:
@@ -31,41 +47,177 @@ class ChannelManager(commands.Cog):
                 if not channel:
                     await asyncio.sleep(30)
                     continue
-                    
-                try:
-                    current_time = datetime.now(timezone.utc)
-                    async for message in channel.history(limit=None):
-                        # Skip pinned messages
-                        if message.pinned:
-                            continue
-                            
-                        # Calculate message age
-                        message_age = (current_time - message.created_at).total_seconds()
-                        
-                        # Bot messages: Delete if older than 8 hours
-                        if message.author.bot:
-                            if message_age > (15 * 60):  # 15 minutes in seconds
-                                await message.delete()
-                                logger.debug("Deleted bot message")
-                        # Non-bot messages: Delete if older than 15 minutes
-                        else:
-                            if message_age > (15 * 60):  # 15 minutes in seconds
-                                await message.delete()
-                                logger.debug("Deleted user message")
-                                
-                        # Add a small delay to avoid rate limits
-                        await asyncio.sleep(1)
-                        
-                except Exception as e:
-                    logger.error(f"Error cleaning messages in raid channel: {e}", exc_info=True)
-                    
-                # Run cleanup every 5 minutes
-                await asyncio.sleep(30)
+
+                if caught_up_channel != channel.id:
+                    # One-time scan for anything that arrived while we weren't listening
+                    await self.catch_up_cleanup(channel)
+                    caught_up_channel = channel.id
+
+                await self.wait_for_expiry()
+                await self.reap_expired(channel)
+                self.save_watermark(channel.id)
                 
             except Exception as e:
                 logger.error(f"Error in cleanup task: {e}", exc_info=True)
                 await asyncio.sleep(60)  # Wait a minute before retrying if there's an error
 
+    def schedule_expiry(self, message):
+        """Queue a raid channel message for deletion once it is message_ttl old"""
+        if message.id in self.scheduled_ids:
+            return
+        expires_at = message.created_at.timestamp() + self.message_ttl
+        self.scheduled_ids.add(message.id)
+        heapq.heappush(self.expiry_heap, (expires_at, message.id))
+        if self.expiry_heap[0][1] == message.id:
+            self.expiry_wakeup.set()
+        if not self.cleanup_watermark or message.id > self.cleanup_watermark:
+            self.cleanup_watermark = message.id
+
+    def save_watermark(self, channel_id):
+        """Persist the newest ID with every message up to it handled
+
+        Messages still waiting on a timer are not handled yet, so the mark stops
+        just below the oldest of them and a restart rescans only those."""
+        watermark = min(self.scheduled_ids) - 1 if self.scheduled_ids else self.cleanup_watermark
+        if watermark:
+            self.registry.set_watermark(channel_id, watermark)
+
+    async def get_pinned_ids(self, channel) -> set:
+        """Pinned message IDs, fetched once and then kept current by on_guild_channel_pins_update"""
+        if channel.id not in self.pinned_ids:
+            await self.budget.acquire('discord', background=True)
+            self.pinned_ids[channel.id] = {pin.id for pin in await channel.pins()}
+        return self.pinned_ids[channel.id]
+
+    def clear_expiry_schedule(self):
+        self.expiry_heap.clear()
+        self.scheduled_ids.clear()
+        self.cleanup_watermark = None
+        self.expiry_wakeup.set()
+
+    async def wait_for_expiry(self):
+        """Sleep until the earliest timer fires or an earlier one is scheduled"""
+        self.expiry_wakeup.clear()
+        timeout = None
+        if self.expiry_heap:
+            timeout = self.expiry_heap[0][0] - time.time()
+            if timeout <= 0:
+                return
+        try:
+            await asyncio.wait_for(self.expiry_wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def reap_expired(self, channel):
+        """Delete every message whose timer has fired, in bulk batches"""
+        started = time.monotonic()
+        # Pick up timers due in the next few seconds too, so deletes batch together
+        horizon = time.time() + self.reap_coalesce_seconds
+        expired = []
+        while self.expiry_heap and self.expiry_heap[0][0] <= horizon:
+            _, message_id = heapq.heappop(self.expiry_heap)
+            if message_id in self.scheduled_ids:
+                self.scheduled_ids.discard(message_id)
+                expired.append(message_id)
+
+        if not expired:
+            return
+
+        # Registered long-lived messages (dashboard, raid summary) and other pins are kept
+        registered = self.registry.message_ids(channel.id)
+        expired = [message_id for message_id in expired if message_id not in registered]
+        if not expired:
+            return
+        pinned = await self.get_pinned_ids(channel)
+        expired = [message_id for message_id in expired if message_id not in pinned]
+
+        deleted = await self.delete_messages(channel, expired)
+        elapsed = time.monotonic() - started
+        self.last_cleanup_stats = {'scanned': len(expired), 'deleted': deleted, 'seconds': elapsed}
+        logger.info(f"Raid channel cleanup: reaped {deleted}/{len(expired)} expired messages in {elapsed:.2f}s")
+
+    async def delete_messages(self, channel, message_ids):
+        """Bulk delete by ID, 100 per call, falling back to single deletes on failure"""
+        deleted = 0
+        single = []
+        for i in range(0, len(message_ids), 100):
+            batch = [discord.Object(id=message_id) for message_id in message_ids[i:i + 100]]
+            # Cleanup is background work: it yields to raids when the budget is tight
+            await self.budget.acquire('discord', background=True)
+            try:
+                await channel.delete_messages(batch)
+                deleted += len(batch)
+            except discord.HTTPException as e:
+                # A message in the batch vanished or aged out; retry one by one
+                logger.debug(f"Bulk delete failed, falling back to single deletes: {e}")
+                single.extend(message.id for message in batch)
+
+        for message_id in single:
+            await self.budget.acquire('discord', background=True)
+            try:
+                await channel.get_partial_message(message_id).delete()
+                deleted += 1
+            except discord.NotFound:
+                logger.debug("Message already deleted")
+        return deleted
+
+    async def catch_up_cleanup(self, channel):
+        """Scan messages newer than the watermark once, at startup or reconnect
+
+        Already-expired messages are deleted straight away (bulk for anything
+        under 14 days old); the rest are handed to the expiry timers."""
+        started = time.monotonic()
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(seconds=self.message_ttl)
+        bulk_cutoff = now - timedelta(days=14) + timedelta(minutes=5)  # Margin for clock skew
+
+        # In memory after a reconnect; from the registry after a restart
+        watermark = self.cleanup_watermark or self.registry.get_watermark(channel.id)
+        after = discord.Object(id=watermark) if watermark else None
+        scanned = 0
+        bulk, single = [], []
+
+        async for message in channel.history(limit=None, after=after, oldest_first=True):
+            scanned += 1
+            if message.pinned:
+                continue
+            if message.created_at > cutoff:
+                self.schedule_expiry(message)
+            elif message.created_at > bulk_cutoff:
+                bulk.append(message.id)
+            else:
+                single.append(message)
+
+        deleted = await self.delete_messages(channel, bulk)
+        for message in single:
+            await self.budget.acquire('discord', background=True)
+            try:
+                await message.delete()
+                deleted += 1
+            except discord.NotFound:
+                logger.debug("Message already deleted")
+
+        self.save_watermark(channel.id)
+        elapsed = time.monotonic() - started
+        self.last_cleanup_stats = {'scanned': scanned, 'deleted': deleted, 'seconds': elapsed}
+        logger.info(f"Raid channel catch-up: scanned {scanned}, deleted {deleted} in {elapsed:.2f}s")
+
+    @commands.Cog.listener()
+    async def on_message(self, message):
+        # Covers user messages and everything the raid cogs send, since the bot sees its own messages
+        if self.raid_channel_id and message.channel.id == self.raid_channel_id and not message.pinned:
+            self.schedule_expiry(message)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_pins_update(self, channel, last_pin):
+        # Re-fetched on the next reap that needs it, instead of polling pins every cycle
+        self.pinned_ids.pop(channel.id, None)
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload):
+        # Lazy removal: the heap entry is skipped when its timer fires
+        self.scheduled_ids.discard(payload.message_id)
+
     def get_trend_indicator(self, current, previous):
         if previous is None:
             return "➖"  # First reading
@@ -76,8 +228,121 @@ class ChannelManager(commands.Cog):
         else:
             return "➖"  # No change
         
+    def format_change(self, source, change):
+        change_text = f"{change:,.0f}" if source.value_type == 'int' else f"{change:.1f}"
+        return f"{'+' if change > 0 else ''}{change_text}{source.change_unit}"
+
+    def create_token_embed(self, metric_raid, token, current_metrics):
+        """Dashboard page for a single token"""
+        title = "📊 **LIVE SENTIMENT METRICS**"
+        if len(metric_raid.tokens) > 1:
+            title += f" | {token.symbol}"
+
+        embed = discord.Embed(
+            title=title,
+            color=0x1DA1F2,
+            timestamp=datetime.now(timezone.utc)
+        )
+
+        # Add fields with metrics AND LINKS!
+        changes = []
+        ranges = []
+        for index, source in enumerate(metric_raid.sources.values()):
+            value = current_metrics[(token.symbol, source.name)]
+            series = metric_raid.get_series(token.symbol, source.name)
+            trend = self.get_trend_indicator(value, series.value_ago('5m'))
+
+            # Add separator between sources
+            if index:
+                embed.add_field(name="\u200b", value="\u200b", inline=False)
+            embed.add_field(
+                name=f"**{source.label}**",
+                value=(
+                    f"{source.dashboard_label}: **{source.format_value(value)}** {trend}\n"
+                    f"[View/Vote]({source.link_for(token)})"
+                ),
+                inline=False
+            )
+
+            deltas = [
+                f"{window} {self.format_change(source, delta)}"
+                for window in ('5m', '1h', '24h')
+                if (delta := series.delta(window)) is not None
+            ]
+            if deltas:
+                changes.append(f"{source.label}: " + " | ".join(deltas))
+
+            low, high = series.range('24h')
+            if low is not None and low != high:
+                ranges.append(f"{source.label}: {source.format_value(low)} – {source.format_value(high)}")
+
+        if changes:
+            embed.add_field(
+                name="Changes (5m / 1h / 24h)",
+                value="\n".join(changes),
+                inline=False
+            )
+
+        if ranges:
+            embed.add_field(
+                name="24h Range (min – max)",
+                value="\n".join(ranges),
+                inline=False
+            )
+
+        embed.set_footer(text="Last updated")
+        return embed
+
+    async def attach_token_sparkline(self, metric_raid, token, embed):
+        """24h sparkline per source, stacked in field order, rendered off the event loop"""
+        rows = []
+        for index, source in enumerate(metric_raid.sources.values()):
+            values = metric_raid.get_series(token.symbol, source.name).sample('24h')
+            if len(values) > 1:
+                rows.append((values, None, PALETTE[index % len(PALETTE)]))
+        if not rows:
+            return None
+
+        filename = f"sparkline_{token.symbol.lower()}.png"
+        file = await self.charts.render_file(rows, filename=filename)
+        embed.set_image(url=f"attachment://{filename}")
+        return file
+
+    def create_table_embed(self, metric_raid, current_metrics):
+        """Compact single-embed table used when there are too many tokens for one page each"""
+        sources = list(metric_raid.sources.values())
+        rows = ["Token    " + "".join(f"{source.label[:12]:>14}" for source in sources)]
+        for token in metric_raid.tokens.values():
+            cells = []
+            for source in sources:
+                value = current_metrics[(token.symbol, source.name)]
+                series = metric_raid.get_series(token.symbol, source.name)
+                trend = self.get_trend_indicator(value, series.value_ago('5m'))
+                cells.append(f"{source.format_value(value):>12} {trend}")
+            rows.append(f"{token.symbol[:8]:<9}" + "".join(cells))
+
+        embed = discord.Embed(
+            title="📊 **LIVE SENTIMENT METRICS**",
+            description="```\n" + "\n".join(rows) + "\n```",
+            color=0x1DA1F2,
+            timestamp=datetime.now(timezone.utc)
+        )
+        embed.set_footer(text="Last updated")
+        return embed
+
+    async def send_metrics_message(self, channel, embeds, files=None):
+        message = await channel.send(embeds=embeds, files=files or [])
+        await message.pin()
+        self.registry.set(channel.id, 'metrics_dashboard', message.id)
+
+    def dashboard_interval(self, metric_raid) -> float:
+        """Refresh interval, stretched in proportion to the busiest sentiment lane's spent budget"""
+        pressure = max((self.budget.pressure(f"sentiment:{name}") for name in metric_raid.sources), default=0.0)
+        return self.metrics_interval * (1 + (self.metrics_max_stretch - 1) * pressure)
+
     async def update_metrics_dashboard(self):
         while True:
+            interval = self.metrics_interval
             try:
                 if not self.raid_channel_id:
                     await asyncio.sleep(300)
@@ -88,126 +353,69 @@ class ChannelManager(commands.Cog):
                     await asyncio.sleep(300)
                     continue
 
-                # Get our raid cogs
-                cmc_raid = self.bot.get_cog('CMCRaid')
-                gecko_raid = self.bot.get_cog('GeckoRaid')
-                dextools_raid = self.bot.get_cog('DextoolsRaid')
-
-                if not cmc_raid or not gecko_raid or not dextools_raid:
+                metric_raid = self.bot.get_cog('MetricRaid')
+                if not metric_raid or not metric_raid.sources or not metric_raid.tokens:
                     await asyncio.sleep(300)
                     continue
 
-                # Fetch metrics
-                cmc_likes = await cmc_raid.get_metrics()
-                gecko_sentiment = await gecko_raid.get_metrics()
-                dextools_sentiment = await dextools_raid.get_metrics()
-
-                # Get trend indicators
-                cmc_trend = self.get_trend_indicator(cmc_likes, self.previous_metrics['cmc_likes'])
-                gecko_trend = self.get_trend_indicator(gecko_sentiment, self.previous_metrics['gecko_sentiment'])
-                dextools_trend = self.get_trend_indicator(dextools_sentiment, self.previous_metrics.get('dextools_sentiment'))
-
-                # Store current values as previous for next update
-                self.previous_metrics['cmc_likes'] = cmc_likes
-                self.previous_metrics['gecko_sentiment'] = gecko_sentiment
-                self.previous_metrics['dextools_sentiment'] = dextools_sentiment
-
-                # Create metrics embed
-                embed = discord.Embed(
-                    title="📊 **LIVE SENTIMENT METRICS**",
-                    color=0x1DA1F2,
-                    timestamp=datetime.now(timezone.utc)
-                )
-
-                # Add fields with metrics AND LINKS!
-                embed.add_field(
-                    name="**CoinMarketCap**",
-                    value=(
-                        f"Upvotes: **{cmc_likes}** {cmc_trend}\n"
-                        "[View/Vote](https://coinmarketcap.com/dexscan/solana/2KB3i5uLKhUcjUwq3poxHpuGGqBWYwtTk5eG9E5WnLG6)"
-                    ),
-                    inline=False
-                )
-
-                # Add separator
-                embed.add_field(name="\u200b", value="\u200b", inline=False)
-                embed.add_field(
-                    name="**GeckoTerminal**",
-                    value=(
-                        f"Sentiment: **{gecko_sentiment:.1f}%** {gecko_trend}\n"
-                        "[View/Vote](https://www.geckoterminal.com/solana/pools/2KB3i5uLKhUcjUwq3poxHpuGGqBWYwtTk5eG9E5WnLG6)"
-                    ),
-                    inline=False
-                )
-
-                # Add separator and Dextools
-                embed.add_field(name="\u200b", value="\u200b", inline=False)
-                embed.add_field(
-                    name="**Dextools**",
-                    value=(
-                        f"Sentiment: **{dextools_sentiment:.1f}%** {dextools_trend}\n"
-                        "[View/Vote](https://www.dextools.io/app/en/solana/pair-explorer/2KB3i5uLKhUcjUwq3poxHpuGGqBWYwtTk5eG9E5WnLG6)"
-                    ),
-                    inline=False
-                )
-
-                if self.previous_metrics['cmc_likes'] is not None:
-                    changes = []
-                    cmc_change = cmc_likes - self.previous_metrics['cmc_likes']
-                    gecko_change = gecko_sentiment - self.previous_metrics['gecko_sentiment']
-                    dextools_change = dextools_sentiment - self.previous_metrics['dextools_sentiment']
-                    
-                    if cmc_change != 0:
-                        changes.append(f"CMC: {'+'if cmc_change>0 else ''}{cmc_change} votes")
-                    if gecko_change != 0:
-                        changes.append(f"Gecko: {'+'if gecko_change>0 else ''}{gecko_change:.1f}%")
-                    if dextools_change != 0:
-                        changes.append(f"Dextools: {'+'if dextools_change>0 else ''}{dextools_change:.1f}%")
-                    
-                    if changes:
-                        embed.add_field(
-                            name="Changes (5m)",
-                            value="\n".join(changes),
-                            inline=False
-                        )
-
-                embed.set_footer(text="Last updated")
-
-                # Find and update existing metrics message
-                if not self.metrics_message_id:
+                # Fetch every source for every token in one concurrent batch. The dashboard
+                # is background work, so it slows down on its own when quotas run low.
+                current_metrics = await metric_raid.fetch_all(background=True)
+                # Leave the remaining quota to raids while it is low
+                interval = self.dashboard_interval(metric_raid)
+
+                # One page per token while they fit in a single message, otherwise a table
+                files = []
+                if len(metric_raid.tokens) <= self.max_token_pages:
+                    embeds = []
+                    for token in metric_raid.tokens.values():
+                        embed = self.create_token_embed(metric_raid, token, current_metrics)
+                        try:
+                            if file := await self.attach_token_sparkline(metric_raid, token, embed):
+                                files.append(file)
+                        except Exception as e:
+                            # A missing chart never holds up the numbers
+                            logger.warning(f"Error rendering sparkline for {token.symbol}: {e}")
+                        embeds.append(embed)
+                else:
+                    embeds = [self.create_table_embed(metric_raid, current_metrics)]
+
+                # Registry first; the pins scan only runs if we have never seen the message
+                metrics_message_id = self.registry.get(channel.id, 'metrics_dashboard')
+                if not metrics_message_id:
                     # Look for existing metrics message in pins
                     pins = await channel.pins()
                     for pin in pins:
                         if (pin.author == self.bot.user and 
                             pin.embeds and 
                             "📊 **LIVE SENTIMENT METRICS**" in pin.embeds[0].title):
-                            self.metrics_message_id = pin.id
+                            metrics_message_id = pin.id
+                            self.registry.set(channel.id, 'metrics_dashboard', pin.id)
                             break
 
                 try:
-                    if self.metrics_message_id:
-                        # Try to update existing message
-                        message = await channel.fetch_message(self.metrics_message_id)
-                        await message.edit(embed=embed)
+                    await self.budget.acquire('discord', background=True)
+                    if metrics_message_id:
+                        # Edit in place: a single request, no fetch
+                        # Passing attachments replaces the previous sparkline images
+                        await channel.get_partial_message(metrics_message_id).edit(embeds=embeds, attachments=files)
                     else:
                         # Create new message if none exists
-                        message = await channel.send(embed=embed)
-                        await message.pin()
-                        self.metrics_message_id = message.id
+                        await self.send_metrics_message(channel, embeds, files)
                 except discord.NotFound:
                     # Message was deleted, create new one
-                    message = await channel.send(embed=embed)
-                    await message.pin()
-                    self.metrics_message_id = message.id
+                    for file in files:
+                        file.reset()
+                    await self.send_metrics_message(channel, embeds, files)
                 except Exception as e:
+                    # Transient errors keep the registered ID; only NotFound replaces the message
                     logger.warning(f"Error updating metrics message: {e}")
-                    self.metrics_message_id = None  # Reset ID on error
 
             except Exception as e:
                 logger.warning(f"Error in metrics dashboard task: {e}")
 
-            # Update every 5 minutes
-            await asyncio.sleep(300)
+            # Every 5 minutes, longer while the sentiment budget is under pressure
+            await asyncio.sleep(interval)
 
     @commands.Cog.listener()
     async def on_ready(self):
@@ -284,6 +492,7 @@ class ChannelManager(commands.Cog):
         """Set the raid channel by ID"""
         try:
             self.raid_channel_id = int(channel_id)
+            self.clear_expiry_schedule()
             
             # Update environment
             env_path = '.env'
@@ -311,7 +520,7 @@ class ChannelManager(commands.Cog):
             os.environ['RAID_CHANNEL_ID'] = channel_id
             
             # Update other cogs
-            for cog_name in ['TwitterRaid', 'CMCRaid', 'GeckoRaid', 'DextoolsRaid']:
+            for cog_name in ['TwitterRaid', 'MetricRaid', 'CompositeRaid']:
                 if cog := self.bot.get_cog(cog_name):
                     cog.raid_channel_id = self.raid_channel_id
             
@@ -323,6 +532,84 @@ class ChannelManager(commands.Cog):
             logger.error(f"Error setting raid channel: {e}", exc_info=True)
             await ctx.send(f"❌ Error setting raid channel: {str(e)}", delete_after=30)
 
+    @commands.command(name='request_budget')
+    @commands.has_permissions(manage_channels=True)
+    async def request_budget(self, ctx):
+        """Show remaining request budget per upstream"""
+        embed = discord.Embed(
+            title="📉 Request Budget",
+            color=0x1DA1F2
+        )
+
+        snapshot = self.budget.snapshot()
+        for name, lane in snapshot.items():
+            embed.add_field(
+                name=name,
+                value=(
+                    f"Tokens: **{lane['tokens']:.1f}** / {lane['capacity']:.0f}\n"
+                    f"Waiting: {lane['waiting']} | Granted: {lane['granted']} | Avg wait: {lane['avg_wait']:.1f}s"
+                ),
+                inline=False
+            )
+
+        if not snapshot:
+            embed.description = "No upstream has been used yet."
+
+        await ctx.send(embed=embed, delete_after=30)
+
+    @commands.command(name='chart_stats')
+    @commands.has_permissions(manage_channels=True)
+    async def chart_stats(self, ctx):
+        """Show sparkline render and cache statistics"""
+        stats = self.charts.stats()
+        embed = discord.Embed(
+            title="📈 Chart Rendering",
+            color=0x1DA1F2
+        )
+        embed.add_field(name="Renders", value=f"{stats['renders']:,}", inline=True)
+        embed.add_field(name="Cache hits", value=f"{stats['hits']:,} ({stats['hit_rate']:.0%})", inline=True)
+        embed.add_field(name="Avg render", value=f"{stats['avg_render_ms']:.1f} ms", inline=True)
+        embed.add_field(name="Cached images", value=str(stats['cached']), inline=True)
+        await ctx.send(embed=embed, delete_after=30)
+
+    @commands.command(name='telegram_stats')
+    @commands.has_permissions(manage_channels=True)
+    async def telegram_stats(self, ctx):
+        """Show Telegram connection cost and connection reuse"""
+        embed = discord.Embed(
+            title="✈️ Telegram Client",
+            color=0x1DA1F2
+        )
+
+        twitter_raid = self.bot.get_cog('TwitterRaid')
+        whale_monitor = self.bot.get_cog('WhaleMonitor')
+        messengers = [
+            ("Raids", twitter_raid.telegram if twitter_raid else None),
+            ("Whale mirror", getattr(whale_monitor, 'telegram', None)),
+        ]
+        for name, messenger in messengers:
+            if not messenger:
+                continue
+            stats = messenger.summary()
+            embed.add_field(
+                name=name,
+                value=(
+                    f"Status: {'🟢 Connected' if stats['connected'] else '⚪ Not connected yet'} | "
+                    f"Chats: {stats['chats']} ({stats['locked']} locked)\n"
+                    f"Connects: {stats['connects']} (avg {stats['avg_connect']:.2f}s) | Failed: {stats['failed_connects']}\n"
+                    f"Requests: {stats['requests']:,} ({stats['requests_per_connect']:.1f} per connect)\n"
+                    f"First request: {stats['first_request'] * 1000:.0f} ms | "
+                    f"Warm avg: {stats['avg_warm_request'] * 1000:.0f} ms\n"
+                    f"Media sent by file_id: {stats['media_hits']:,} | Uploaded from URL: {stats['media_uploads']:,}"
+                ),
+                inline=False
+            )
+
+        if not embed.fields:
+            embed.description = "Telegram is not configured."
+
+        await ctx.send(embed=embed, delete_after=30)
+
     @commands.command(name='raid_stop')
     @commands.has_permissions(manage_channels=True)
     async def raid_stop(self, ctx):
@@ -332,9 +619,8 @@ class ChannelManager(commands.Cog):
 
         # Get the active raids from both raid cogs
         twitter_raid = self.bot.get_cog('TwitterRaid')
-        cmc_raid = self.bot.get_cog('CMCRaid')
-        gecko_raid = self.bot.get_cog('GeckoRaid')
-        dextools_raid = self.bot.get_cog('DextoolsRaid')
+        metric_raid = self.bot.get_cog('MetricRaid')
+        composite_raid = self.bot.get_cog('CompositeRaid')
         
         channel_locked = False
         
@@ -368,8 +654,7 @@ class ChannelManager(commands.Cog):
 
                 # Unlock Telegram chat and delete message
                 try:
-                    if twitter_raid.telegram.current_message_id:
-                        await twitter_raid.telegram.delete_message(twitter_raid.telegram.current_message_id)
+                    await twitter_raid.telegram.delete_raid_messages()
                     await twitter_raid.telegram.unlock_chat()
                 except Exception as e:
                     logger.error(f"Error cleaning up Telegram: {e}", exc_info=True)
@@ -379,10 +664,10 @@ class ChannelManager(commands.Cog):
             except Exception as e:
                 logger.error(f"Error in raid_stop (Twitter): {e}", exc_info=True)
                 
-        # Check CMCRaid
-        if cmc_raid and ctx.channel.id in cmc_raid.locked_channels:
+        # Check MetricRaid (CMC, Gecko, Dextools and any other configured source)
+        if metric_raid and ctx.channel.id in metric_raid.locked_channels:
             try:
-                challenge_data = cmc_raid.engagement_targets.get(ctx.channel.id)
+                challenge_data = metric_raid.engagement_targets.get(ctx.channel.id)
                 if challenge_data:
                     try:
                         # Delete lock message
@@ -404,69 +689,19 @@ class ChannelManager(commands.Cog):
                     except Exception as e:
                         logger.error(f"Error deleting progress message: {e}", exc_info=True)
 
-                await cmc_raid.unlock_channel(ctx.channel)
-                channel_locked = True
-                
-            except Exception as e:
-                logger.error(f"Error in raid_stop (CMC): {e}", exc_info=True)
-
-        # Add Gecko check
-        if gecko_raid and ctx.channel.id in gecko_raid.locked_channels:
-            try:
-                challenge_data = gecko_raid.engagement_targets.get(ctx.channel.id)
-                if challenge_data:
-                    try:
-                        lock_message = await ctx.channel.fetch_message(challenge_data['lock_message_id'])
-                        if lock_message:
-                            await lock_message.delete()
-                    except discord.NotFound:
-                        logger.debug("Lock message already deleted")
-                    except Exception as e:
-                        logger.error(f"Error deleting lock message: {e}", exc_info=True)
-                        
-                    try:
-                        progress_message = await ctx.channel.fetch_message(challenge_data['message_id'])
-                        if progress_message:
-                            await progress_message.delete()
-                    except discord.NotFound:
-                        logger.debug("Progress message already deleted")
-                    except Exception as e:
-                        logger.error(f"Error deleting progress message: {e}", exc_info=True)
-
-                await gecko_raid.unlock_channel(ctx.channel)
+                await metric_raid.unlock_channel(ctx.channel)
                 channel_locked = True
                 
             except Exception as e:
-                logger.error(f"Error in raid_stop (Gecko): {e}", exc_info=True)
+                logger.error(f"Error in raid_stop (MetricRaid): {e}", exc_info=True)
 
-        # Add Dextools check
-        if dextools_raid and ctx.channel.id in dextools_raid.locked_channels:
+        # Check CompositeRaid
+        if composite_raid and ctx.channel.id in composite_raid.locked_channels:
             try:
-                challenge_data = dextools_raid.engagement_targets.get(ctx.channel.id)
-                if challenge_data:
-                    try:
-                        lock_message = await ctx.channel.fetch_message(challenge_data['lock_message_id'])
-                        if lock_message:
-                            await lock_message.delete()
-                    except discord.NotFound:
-                        logger.debug("Lock message already deleted")
-                    except Exception as e:
-                        logger.error(f"Error deleting lock message: {e}", exc_info=True)
-                        
-                    try:
-                        progress_message = await ctx.channel.fetch_message(challenge_data['message_id'])
-                        if progress_message:
-                            await progress_message.delete()
-                    except discord.NotFound:
-                        logger.debug("Progress message already deleted")
-                    except Exception as e:
-                        logger.error(f"Error deleting progress message: {e}", exc_info=True)
-
-                await dextools_raid.unlock_channel(ctx.channel)
+                await composite_raid.stop_raid(ctx.channel)
                 channel_locked = True
-                
             except Exception as e:
-                logger.error(f"Error in raid_stop (Dextools): {e}", exc_info=True)
+                logger.error(f"Error in raid_stop (Composite): {e}", exc_info=True)
 
         if channel_locked:
             await ctx.send("Challenge ended manually. Channel unlocked!", delete_after=5)
@@ -0,0 +1,161 @@
+import io
+import time
+import zlib
+import struct
+import hashlib
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+import discord
+import logging
+
+logger = logging.getLogger('tetsuo_bot.charts')
+
+PALETTE = [
+    (29, 161, 242),   # Twitter blue, matches the dashboard embed color
+    (0, 200, 83),
+    (255, 171, 0),
+    (233, 30, 99),
+    (156, 39, 176),
+]
+TARGET_COLOR = (150, 150, 150)
+
+# (values, target or None, (r, g, b))
+SparkRow = Tuple[Sequence[float], Optional[float], Tuple[int, int, int]]
+
+def _plot(pixels: bytearray, width: int, height: int, x: int, y: int, color):
+    if 0 <= x < width and 0 <= y < height:
+        offset = (y * width + x) * 4
+        pixels[offset:offset + 4] = bytes((*color, 255))
+
+def _line(pixels, width, height, x0, y0, x1, y1, color):
+    """Bresenham line, two pixels thick so it survives Discord's downscaling"""
+    dx, dy = abs(x1 - x0), -abs(y1 - y0)
+    sx, sy = (1 if x0 < x1 else -1), (1 if y0 < y1 else -1)
+    error = dx + dy
+    while True:
+        _plot(pixels, width, height, x0, y0, color)
+        _plot(pixels, width, height, x0, y0 + 1, color)
+        if x0 == x1 and y0 == y1:
+            return
+        doubled = 2 * error
+        if doubled >= dy:
+            error += dy
+            x0 += sx
+        if doubled <= dx:
+            error += dx
+            y0 += sy
+
+def _draw_row(pixels, width, height, top, row_height, values, target, color):
+    values = [value for value in values if value is not None]
+    if not values:
+        return
+
+    bounds = values + ([target] if target is not None else [])
+    low, high = min(bounds), max(bounds)
+    if high == low:
+        low, high = low - 1, high + 1
+    pad = 3
+
+    def y_of(value):
+        return top + pad + int(round((high - value) / (high - low) * (row_height - 1 - 2 * pad)))
+
+    def x_of(index):
+        return int(round(index * (width - 1) / (len(values) - 1))) if len(values) > 1 else width - 1
+
+    if target is not None:
+        target_y = y_of(target)
+        for x in range(0, width, 6):
+            for dash in range(3):
+                _plot(pixels, width, height, x + dash, target_y, TARGET_COLOR)
+
+    points = [(x_of(index), y_of(value)) for index, value in enumerate(values)]
+    for (x0, y0), (x1, y1) in zip(points, points[1:]):
+        _line(pixels, width, height, x0, y0, x1, y1, color)
+
+    # Mark the latest value
+    last_x, last_y = points[-1]
+    for dx in (-2, -1, 0, 1, 2):
+        for dy in (-2, -1, 0, 1, 2):
+            _plot(pixels, width, height, last_x + dx, last_y + dy, color)
+
+def _encode_png(pixels: bytearray, width: int, height: int) -> bytes:
+    stride = width * 4
+    raw = b''.join(b'\x00' + bytes(pixels[y * stride:(y + 1) * stride]) for y in range(height))
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff)
+
+    return (
+        b'\x89PNG\r\n\x1a\n'
+        + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0))
+        + chunk(b'IDAT', zlib.compress(raw, 6))
+        + chunk(b'IEND', b'')
+    )
+
+def render_sparklines(rows: List[SparkRow], width: int = 300, row_height: int = 40, gap: int = 6) -> bytes:
+    """Render one sparkline per row, stacked vertically, as a transparent PNG
+
+    Pure stdlib so it has no extra dependencies; meant to run off the event loop."""
+    height = max(1, len(rows) * row_height + gap * (len(rows) - 1))
+    pixels = bytearray(width * height * 4)
+    for index, (values, target, color) in enumerate(rows):
+        _draw_row(pixels, width, height, index * (row_height + gap), row_height, list(values), target, color)
+    return _encode_png(pixels, width, height)
+
+class SparklineRenderer:
+    """Renders sparklines on a worker thread with a content-addressed cache
+
+    Identical input series hash to the same key, so unchanged data is served
+    from the cache without rendering again."""
+
+    def __init__(self, cache_size: int = 128):
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sparkline')
+        self.cache: OrderedDict[str, bytes] = OrderedDict()
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self.render_seconds = 0.0
+
+    @staticmethod
+    def cache_key(rows: List[SparkRow], width: int, row_height: int) -> str:
+        normalized = [(tuple(values), target, tuple(color)) for values, target, color in rows]
+        return hashlib.sha1(repr((normalized, width, row_height)).encode()).hexdigest()
+
+    async def render(self, rows: List[SparkRow], width: int = 300, row_height: int = 40) -> bytes:
+        key = self.cache_key(rows, width, row_height)
+        if key in self.cache:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return self.cache[key]
+
+        self.misses += 1
+        started = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        png = await loop.run_in_executor(self.executor, render_sparklines, rows, width, row_height)
+        self.render_seconds += time.perf_counter() - started
+
+        self.cache[key] = png
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return png
+
+    async def render_file(self, rows: List[SparkRow], filename: str = 'sparkline.png', **kwargs) -> discord.File:
+        return discord.File(io.BytesIO(await self.render(rows, **kwargs)), filename=filename)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'renders': self.misses,
+            'hits': self.hits,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'avg_render_ms': self.render_seconds / self.misses * 1000 if self.misses else 0.0,
+            'cached': len(self.cache),
+        }
+
+@lru_cache()
+def get_sparkline_renderer() -> SparklineRenderer:
+    """Get the shared sparkline renderer"""
+    return SparklineRenderer()
@@ -0,0 +1,341 @@
+from .base_raid import BaseRaid
+import discord
+from discord.ext import commands
+from datetime import datetime, timezone
+import os
+import re
+import asyncio
+from .scrape_utils import ScrapeUtils
+from .charts import PALETTE
+import logging
+
+logger = logging.getLogger('tetsuo_bot.composite_raid')
+
+TWEET_METRICS = {
+    'likes': '❤️',
+    'retweets': '🔄',
+    'replies': '💬',
+    'bookmarks': '🔖'
+}
+
+class CompositeRaid(BaseRaid):
+    """Raid combining Twitter and metric source targets under a single lock"""
+
+    def __init__(self, bot):
+        super().__init__(bot)
+        self.raid_channel_id = int(os.getenv('RAID_CHANNEL_ID', 0)) or None
+
+    async def get_metrics(self, raid):
+        """Poll every source in the raid concurrently"""
+        twitter_raid = self.bot.get_cog('TwitterRaid')
+        metric_raid = self.bot.get_cog('MetricRaid')
+
+        deadline = None
+        if 'start_time' in raid:
+            deadline = raid['start_time'].timestamp() + raid['timeout'] * 60
+
+        tasks = {}
+        if raid['tweet_url'] and twitter_raid:
+            tasks['tweet'] = twitter_raid.get_tweet_metrics(raid['tweet_url'], deadline)
+        for source_name in raid['source_targets']:
+            tasks[source_name] = metric_raid.get_metrics(source_name, raid['token'], deadline)
+
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+        metrics = {}
+        for key, result in zip(tasks, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching {key} metrics: {result}")
+                continue
+            if key == 'tweet':
+                metrics.update({metric: result.get(metric, 0) for metric in raid['tweet_targets']})
+            else:
+                metrics[key] = result
+        return metrics
+
+    def all_targets(self, raid):
+        return {**raid['tweet_targets'], **raid['source_targets']}
+
+    def record_samples(self, raid, metrics):
+        for metric in self.all_targets(raid):
+            self.record_sample(raid['samples'].setdefault(metric, []), metrics.get(metric, 0))
+
+    def sparkline_rows(self, raid):
+        """One row per target, in the same order as the embed fields"""
+        return [
+            (raid['samples'].get(metric, []), target, PALETTE[index % len(PALETTE)])
+            for index, (metric, target) in enumerate(self.all_targets(raid).items())
+        ]
+
+    def describe_links(self, raid):
+        """Plain text links for Telegram"""
+        metric_raid = self.bot.get_cog('MetricRaid')
+        links = [raid['tweet_url']] if raid['tweet_url'] else []
+        token = metric_raid.get_token(raid['token'])
+        links += [metric_raid.sources[name].link_for(token) for name in raid['source_targets']]
+        return "\n".join(links)
+
+    async def create_progress_embed(self, raid, metrics):
+        """Single combined progress embed for every target in the raid"""
+        metric_raid = self.bot.get_cog('MetricRaid')
+        embed = discord.Embed(
+            title="🎯 Cross-Platform Engagement Challenge 🎯",
+            description="Every target must be met to unlock the channel!",
+            color=0x1DA1F2
+        )
+
+        for metric, target in self.all_targets(raid).items():
+            current = metrics.get(metric, 0)
+            percentage = (current/target*100) if target > 0 else 100
+            progress_bar = self.create_progress_bar(current, target)
+            status_emoji = "✅" if percentage >= 100 else "🔸" if percentage >= 75 else "🔹" if percentage >= 50 else "⭕"
+
+            if metric in raid['tweet_targets']:
+                name = f"{TWEET_METRICS[metric]} Twitter {metric.title()}"
+                current_text, target_text = f"{current}", f"{target}"
+            else:
+                source = metric_raid.sources[metric]
+                name = f"📊 {source.label} {source.dashboard_label}"
+                if len(metric_raid.tokens) > 1:
+                    name += f" ({raid['token']})"
+                current_text, target_text = source.format_value(current), source.format_value(target)
+
+            embed.add_field(
+                name=name,
+                value=(
+                    f"{status_emoji} Progress: {progress_bar} {percentage:.1f}%\n"
+                    f"Current: **{current_text}** / Target: **{target_text}**"
+                ),
+                inline=False
+            )
+
+        links = []
+        if raid['tweet_url']:
+            links.append(f"[Click to view tweet]({raid['tweet_url']})")
+        token = metric_raid.get_token(raid['token'])
+        for name in raid['source_targets']:
+            source = metric_raid.sources[name]
+            links.append(f"[Vote on {source.label}]({source.link_for(token)})")
+        embed.add_field(name="📝 Links", value="\n".join(links), inline=False)
+
+        embed.timestamp = datetime.now(timezone.utc)
+        embed.set_footer(text="Last updated")
+
+        return embed
+
+    @commands.command(name='raid_multi')
+    @commands.has_permissions(manage_channels=True)
+    async def raid_multi(self, ctx, *, targets):
+        """Start a raid tracking several platforms at once
+
+        Usage: !raid_multi [tweet:<tweet_url>] [token:<symbol>] <targets>
+        Example: !raid_multi tweet:https://twitter.com/user/status/123 likes:100 cmc:500 gecko:80 timeout:30
+
+        Available targets:
+        • likes, retweets, replies, bookmarks - Twitter targets (needs tweet:)
+        • <source> - any configured metric source, e.g. cmc, gecko, dextools
+        • timeout - minutes until raid auto-ends (default: 15)"""
+        if not await self.check_raid_channel(ctx):
+            return
+
+        metric_raid = self.bot.get_cog('MetricRaid')
+        twitter_raid = self.bot.get_cog('TwitterRaid')
+        sources = metric_raid.sources if metric_raid else {}
+
+        tweet_url = None
+        token = metric_raid.default_token if metric_raid else None
+        tweet_targets = {}
+        source_targets = {}
+        timeout_minutes = 15  # Default timeout
+
+        for pair in targets.split():
+            if ':' not in pair:
+                continue
+
+            metric, value = pair.split(':', 1)
+            metric = metric.lower()
+
+            try:
+                if metric == 'tweet':
+                    match = re.match(r'^https?://(twitter\.com|x\.com)/\w+/status/\d+', value)
+                    if match:
+                        tweet_url = match.group(0).replace('x.com', 'twitter.com')
+                elif metric == 'token' and metric_raid:
+                    token = metric_raid.get_token(value)
+                elif metric == 'timeout':
+                    timeout_minutes = max(1, min(120, int(value)))
+                elif metric in TWEET_METRICS:
+                    value = int(value)
+                    if 0 < value <= 1000000:
+                        tweet_targets[metric] = value
+                elif metric in sources:
+                    source_targets[metric] = sources[metric].parse_target(value)
+            except ValueError:
+                continue
+
+        if tweet_targets and not tweet_url:
+            await ctx.send("❌ Twitter targets need a valid `tweet:<url>` to track.", delete_after=10)
+            return
+
+        if tweet_targets and not twitter_raid:
+            await ctx.send("❌ Twitter tracking is not available right now.", delete_after=10)
+            return
+
+        if source_targets and token is None:
+            await ctx.send(f"❌ Unknown token. Configured tokens: {', '.join(metric_raid.tokens) or 'none'}", delete_after=10)
+            return
+
+        if not tweet_targets and not source_targets:
+            await ctx.send(
+                "Please provide valid targets (e.g., `tweet:<url> likes:100 "
+                + " ".join(f"{name}:<target>" for name in sources) + "`)"
+            )
+            return
+
+        raid = {
+            'tweet_url': tweet_url,
+            'tweet_targets': tweet_targets,
+            'source_targets': source_targets,
+            'token': token.symbol if token else None,
+            'timeout': timeout_minutes,
+            'samples': {}
+        }
+
+        if not self.reserve_channel(ctx.channel.id):
+            await ctx.send("There's already an active raid in this channel!")
+            return
+
+        channel_locked = telegram_locked = False
+        try:
+            metrics = await self.get_metrics(raid)
+            self.record_samples(raid, metrics)
+
+            await self.lock_channel(ctx.channel)
+            channel_locked = True
+
+            lock_embed = discord.Embed(
+                title="🚨 CHANNEL LOCKED 🚨",
+                description="🔒 This channel is locked until all engagement targets are met! 🔒",
+                color=0xFF0000
+            )
+            lock_embed.set_footer(text="Channel will automatically unlock when targets are reached")
+            lock_message = await ctx.send(content=self.raid_mention, embed=lock_embed)
+
+            embed = await self.create_progress_embed(raid, metrics)
+            progress_message = await ctx.send(embed=embed)
+
+            raid.update({
+                'start_time': datetime.now(timezone.utc),
+                'message_id': progress_message.id,
+                'lock_message_id': lock_message.id
+            })
+            self.engagement_targets[ctx.channel.id] = raid
+
+            if twitter_raid:
+                telegram_locked = True
+                await twitter_raid.telegram.lock_chat()
+                await twitter_raid.telegram.send_raid_message(self.describe_links(raid), self.all_targets(raid), metrics)
+
+            self.bot.loop.create_task(self.monitor_raid(ctx.channel, raid))
+
+        except Exception as e:
+            logger.error(f"Error in raid_multi: {e}", exc_info=True)
+            await ctx.send(f"Error: {str(e)}")
+            if channel_locked:
+                await self.unlock_channel(ctx.channel)
+            else:
+                self.release_channel(ctx.channel.id)
+            if telegram_locked:
+                await twitter_raid.telegram.unlock_chat()
+
+    async def finish_raid(self, channel, raid, metrics, success):
+        """Unlock both platforms and render the final state once"""
+        twitter_raid = self.bot.get_cog('TwitterRaid')
+        await self.unlock_channel(channel)
+
+        try:
+            await channel.get_partial_message(raid['lock_message_id']).delete()
+        except discord.NotFound:
+            logger.debug("Lock message already deleted")
+
+        final_embed = await self.create_progress_embed(raid, metrics)
+        final_embed.add_field(name="\u200b", value="\u200b", inline=False)
+        if success:
+            final_embed.color = 0x00FF00
+            final_embed.add_field(
+                name="🎉 CHALLENGE COMPLETE! 🎉",
+                value="```diff\n+ All targets reached! Channel unlocked! 🔓\n```",
+                inline=False
+            )
+        else:
+            final_embed.color = 0xFF6B6B
+            final_embed.add_field(
+                name="⏰ RAID TIMED OUT! ⏰",
+                value=f"```diff\n- Raid ended after {raid['timeout']} minutes! Channel unlocked! 🔓\n```",
+                inline=False
+            )
+        files = await self.attach_sparkline(final_embed, self.sparkline_rows(raid))
+        await channel.get_partial_message(raid['message_id']).edit(embed=final_embed, attachments=files)
+
+        if twitter_raid:
+            if success:
+                await twitter_raid.telegram.update_progress(metrics, self.all_targets(raid), self.describe_links(raid))
+            await twitter_raid.telegram.unlock_chat()
+
+    async def monitor_raid(self, channel, raid):
+        """Poll all sources on one schedule until every target is met or the raid times out"""
+        twitter_raid = self.bot.get_cog('TwitterRaid')
+        targets = self.all_targets(raid)
+        metrics = {}
+
+        while self.locked_channels.get(channel.id):
+            try:
+                metrics = await self.get_metrics(raid)
+
+                if not self.locked_channels.get(channel.id):
+                    break
+                self.record_samples(raid, metrics)
+
+                if (datetime.now(timezone.utc) - raid['start_time']).total_seconds() > raid['timeout'] * 60:
+                    await self.finish_raid(channel, raid, metrics, success=False)
+                    return
+
+                if all(metrics.get(metric, 0) >= target for metric, target in targets.items()):
+                    await self.finish_raid(channel, raid, metrics, success=True)
+                    return
+
+                embed = await self.create_progress_embed(raid, metrics)
+                files = await self.attach_sparkline(embed, self.sparkline_rows(raid))
+                await channel.get_partial_message(raid['message_id']).edit(embed=embed, attachments=files)
+                if twitter_raid:
+                    await twitter_raid.telegram.update_progress(metrics, targets, self.describe_links(raid))
+
+            except Exception as e:
+                logger.error(f"Error monitoring composite raid: {e}", exc_info=True)
+
+            await ScrapeUtils.random_delay(30)  # 30 seconds base with jitter
+
+    async def stop_raid(self, channel):
+        """Manually end the raid, removing its messages on both platforms"""
+        raid = self.engagement_targets.get(channel.id)
+        if raid:
+            for key in ('lock_message_id', 'message_id'):
+                try:
+                    await channel.get_partial_message(raid[key]).delete()
+                except discord.NotFound:
+                    logger.debug("Raid message already deleted")
+                except Exception as e:
+                    logger.error(f"Error deleting raid message: {e}", exc_info=True)
+
+        await self.unlock_channel(channel)
+
+        twitter_raid = self.bot.get_cog('TwitterRaid')
+        if twitter_raid:
+            try:
+                await twitter_raid.telegram.delete_raid_messages()
+                await twitter_raid.telegram.unlock_chat()
+            except Exception as e:
+                logger.error(f"Error cleaning up Telegram: {e}", exc_info=True)
+
+async def setup(bot):
+    await bot.add_cog(CompositeRaid(bot))
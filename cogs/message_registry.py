@@ -0,0 +1,76 @@
+import os
+import json
+from pathlib import Path
+from functools import lru_cache
+from typing import Dict, Optional
+import logging
+
+logger = logging.getLogger('tetsuo_bot.message_registry')
+
+class MessageRegistry:
+    """Persisted IDs of the bot's long-lived messages (pinned dashboard, raid summary)
+
+    Keyed by channel ID and a purpose string, so steady-state updates can edit
+    the message directly instead of scanning the channel's pins first. Also
+    holds each channel's cleanup watermark, so a restart's catch-up scan
+    starts where the last run left off."""
+
+    def __init__(self, path: str = None):
+        self.path = Path(path or os.getenv('MESSAGE_REGISTRY_FILE', 'message_registry.json'))
+        self.messages: Dict[str, Dict[str, int]] = {}
+        self.watermarks: Dict[str, int] = {}  # channel ID -> newest message ID with everything up to it handled
+        self.load()
+
+    def load(self):
+        try:
+            if self.path.exists():
+                data = json.loads(self.path.read_text())
+                if 'messages' in data:
+                    self.messages = data['messages']
+                    self.watermarks = data.get('watermarks', {})
+                else:
+                    # Older files hold only the messages mapping
+                    self.messages = data
+        except Exception as e:
+            logger.error(f"Error loading message registry: {e}", exc_info=True)
+            self.messages = {}
+            self.watermarks = {}
+
+    def save(self):
+        try:
+            tmp_path = self.path.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps({'messages': self.messages, 'watermarks': self.watermarks}, indent=2))
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"Error saving message registry: {e}", exc_info=True)
+
+    def get(self, channel_id: int, key: str) -> Optional[int]:
+        return self.messages.get(str(channel_id), {}).get(key)
+
+    def set(self, channel_id: int, key: str, message_id: int):
+        if self.get(channel_id, key) == message_id:
+            return
+        self.messages.setdefault(str(channel_id), {})[key] = message_id
+        self.save()
+
+    def remove(self, channel_id: int, key: str):
+        if self.messages.get(str(channel_id), {}).pop(key, None) is not None:
+            self.save()
+
+    def message_ids(self, channel_id: int) -> set:
+        """Every registered message in a channel"""
+        return set(self.messages.get(str(channel_id), {}).values())
+
+    def get_watermark(self, channel_id: int) -> Optional[int]:
+        return self.watermarks.get(str(channel_id))
+
+    def set_watermark(self, channel_id: int, message_id: int):
+        if self.get_watermark(channel_id) == message_id:
+            return
+        self.watermarks[str(channel_id)] = message_id
+        self.save()
+
+@lru_cache()
+def get_message_registry() -> MessageRegistry:
+    """Get the shared message registry"""
+    return MessageRegistry()
@@ -0,0 +1,195 @@
+import os
+import json
+import time
+from array import array
+from collections import deque
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import logging
+
+logger = logging.getLogger('tetsuo_bot.metric_history')
+
+WINDOWS = {
+    '5m': 5 * 60,
+    '1h': 60 * 60,
+    '24h': 24 * 60 * 60,
+}
+
+# Gaps up to two dashboard refreshes are bridged with the last value. Longer
+# ones (outages, restarts) stay empty so deltas across them read as unknown.
+MAX_CARRY_SECONDS = 2 * 5 * 60
+
+class MetricSeries:
+    """Fixed-slot ring buffer of a single metric.
+
+    Time is cut into slots of slot_seconds; the latest value recorded in a
+    slot wins. Values live in flat arrays indexed by slot % capacity, so the
+    value N windows ago is a single index lookup. Min/max per window are kept
+    in monotonic deques that are updated as each slot closes, giving amortized
+    O(1) work per update and O(1) queries."""
+
+    def __init__(self, slot_seconds: int = 60, windows: Dict[str, int] = WINDOWS, max_carry_seconds: int = MAX_CARRY_SECONDS):
+        self.slot_seconds = slot_seconds
+        self.max_carry_slots = max(1, -(-max_carry_seconds // slot_seconds))
+        self.window_slots = {name: max(1, seconds // slot_seconds) for name, seconds in windows.items()}
+        self.capacity = max(self.window_slots.values()) + 1
+        self.slots = array('q', [-1]) * self.capacity
+        self.values = array('d', [0.0]) * self.capacity
+        self.current_slot = None
+        self.current_value = None
+        # Closed slots only: (min deque, max deque) of (slot, value) per window
+        self.extremes = {name: (deque(), deque()) for name in self.window_slots}
+
+    def _store(self, slot: int, value: float):
+        index = slot % self.capacity
+        self.slots[index] = slot
+        self.values[index] = value
+
+    def _close(self, slot: int, value: float):
+        """Finalize a slot and feed it to the per-window min/max deques"""
+        self._store(slot, value)
+        for mins, maxs in self.extremes.values():
+            while mins and mins[-1][1] >= value:
+                mins.pop()
+            mins.append((slot, value))
+            while maxs and maxs[-1][1] <= value:
+                maxs.pop()
+            maxs.append((slot, value))
+
+    def _evict(self, window: str):
+        earliest = self.current_slot - self.window_slots[window]
+        for extremes in self.extremes[window]:
+            while extremes and extremes[0][0] < earliest:
+                extremes.popleft()
+
+    def record(self, value: float, timestamp: float = None):
+        """Record a value, closing out any slots that elapsed since the last one"""
+        slot = int((timestamp or time.time()) // self.slot_seconds)
+
+        if self.current_slot is not None:
+            if slot < self.current_slot:
+                return  # Out of order sample, ignore
+            if slot > self.current_slot:
+                if slot - self.current_slot <= self.max_carry_slots:
+                    # Short gap: carry the last value across it
+                    for closed in range(self.current_slot, slot):
+                        self._close(closed, self.current_value)
+                else:
+                    # Long gap: close the last real slot and leave the rest empty
+                    self._close(self.current_slot, self.current_value)
+
+        self.current_slot = slot
+        self.current_value = value
+        self._store(slot, value)
+        for window in self.extremes:
+            self._evict(window)
+
+    def value_at(self, slot: int) -> Optional[float]:
+        index = slot % self.capacity
+        return self.values[index] if self.slots[index] == slot else None
+
+    def value_ago(self, window: str) -> Optional[float]:
+        """Value one window before the current slot, if the buffer has it"""
+        if self.current_slot is None:
+            return None
+        return self.value_at(self.current_slot - self.window_slots[window])
+
+    def delta(self, window: str) -> Optional[float]:
+        previous = self.value_ago(window)
+        return None if previous is None else self.current_value - previous
+
+    def range(self, window: str) -> Tuple[Optional[float], Optional[float]]:
+        """(min, max) over the window including the current slot"""
+        if self.current_slot is None:
+            return None, None
+        self._evict(window)
+        mins, maxs = self.extremes[window]
+        low = min(mins[0][1], self.current_value) if mins else self.current_value
+        high = max(maxs[0][1], self.current_value) if maxs else self.current_value
+        return low, high
+
+    def points(self):
+        """Closed (slot, value) pairs in slot order, oldest first"""
+        if self.current_slot is None:
+            return []
+        start = self.current_slot - self.capacity + 1
+        return [
+            (slot, value) for slot in range(start, self.current_slot)
+            if (value := self.value_at(slot)) is not None
+        ]
+
+    def sample(self, window: str, count: int = 96) -> list:
+        """Up to `count` evenly spaced values over the window, ending with the current one"""
+        if self.current_slot is None:
+            return []
+        span = self.window_slots[window]
+        step = max(1, span // count)
+        values = [
+            value for slot in range(self.current_slot - span + step, self.current_slot, step)
+            if (value := self.value_at(slot)) is not None
+        ]
+        values.append(self.current_value)
+        return values
+
+    def to_dict(self) -> dict:
+        return {
+            'current_slot': self.current_slot,
+            'current_value': self.current_value,
+            'points': self.points()
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, slot_seconds: int) -> 'MetricSeries':
+        series = cls(slot_seconds)
+        for slot, value in data.get('points', []):
+            series._close(int(slot), float(value))
+        if data.get('current_slot') is not None:
+            series.current_slot = int(data['current_slot'])
+            series.current_value = float(data['current_value'])
+            series._store(series.current_slot, series.current_value)
+        return series
+
+class MetricHistory:
+    """Per-source metric series, persisted to a small JSON file"""
+
+    def __init__(self, path: str = None, slot_seconds: int = 60):
+        self.path = Path(path or os.getenv('METRIC_HISTORY_FILE', 'metric_history.json'))
+        self.slot_seconds = slot_seconds
+        self.series: Dict[str, MetricSeries] = {}
+
+    def get(self, key: str) -> MetricSeries:
+        if key not in self.series:
+            self.series[key] = MetricSeries(self.slot_seconds)
+        return self.series[key]
+
+    def record(self, key: str, value: float, timestamp: float = None):
+        self.get(key).record(value, timestamp)
+
+    @classmethod
+    def load(cls, path: str = None, slot_seconds: int = 60) -> 'MetricHistory':
+        history = cls(path, slot_seconds)
+        try:
+            if history.path.exists():
+                data = json.loads(history.path.read_text())
+                if data.get('slot_seconds') == slot_seconds:
+                    history.series = {
+                        key: MetricSeries.from_dict(series, slot_seconds)
+                        for key, series in data.get('series', {}).items()
+                    }
+                else:
+                    logger.warning("Metric history slot size changed, starting fresh")
+        except Exception as e:
+            logger.error(f"Error loading metric history: {e}", exc_info=True)
+        return history
+
+    def save(self):
+        try:
+            data = {
+                'slot_seconds': self.slot_seconds,
+                'series': {key: series.to_dict() for key, series in self.series.items()}
+            }
+            tmp_path = self.path.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps(data))
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"Error saving metric history: {e}", exc_info=True)
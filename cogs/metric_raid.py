@@ -0,0 +1,364 @@
+from .base_raid import BaseRaid
+from .metric_sources import MetricSource, Token, load_metric_sources, load_tokens
+from .request_budget import get_request_budget
+from .metric_history import MetricHistory
+from .charts import PALETTE
+import discord
+from discord.ext import commands
+from datetime import datetime, timezone
+import os
+import asyncio
+import aiohttp
+import logging
+
+logger = logging.getLogger('tetsuo_bot.metric_raid')
+
+class MetricRaid(BaseRaid):
+    """Generic raid cog driven by the metric source registry.
+
+    One command is registered per configured source, and every active raid
+    is polled from a single scheduler task over one shared HTTP session."""
+
+    def __init__(self, bot):
+        super().__init__(bot)
+        self.raid_channel_id = int(os.getenv('RAID_CHANNEL_ID', 0)) or None
+        self.sources = load_metric_sources()
+        self.tokens = load_tokens()
+        if len(self.tokens) > 1:
+            for source in self.sources.values():
+                if not source.per_pool:
+                    logger.warning(f"{source.label} is not per_pool; every token shows the same value")
+        self.api_url = os.getenv('API_URL')
+        self.api_token = os.getenv('API_TOKEN')
+        self.headers = {'Authorization': f'Bearer {self.api_token}'}
+        self.poll_interval = 30
+        self.budget = get_request_budget()
+        self.history = MetricHistory.load()
+        self.history_save_interval = 600
+        self.session = None
+        self.poll_task = None
+        self.history_task = None
+        self.registered_commands = []
+
+    async def cog_load(self):
+        self.session = aiohttp.ClientSession(headers=self.headers)
+        for source in self.sources.values():
+            self.register_source_command(source)
+        self.poll_task = asyncio.create_task(self.poll_raids())
+        self.history_task = asyncio.create_task(self.persist_history())
+        logger.info(f"MetricRaid: registered {len(self.registered_commands)} raid commands")
+
+    async def cog_unload(self):
+        if self.poll_task:
+            self.poll_task.cancel()
+        if self.history_task:
+            self.history_task.cancel()
+        self.history.save()
+        for name in self.registered_commands:
+            self.bot.remove_command(name)
+        self.registered_commands.clear()
+        if self.session:
+            await self.session.close()
+            self.session = None
+
+    def register_source_command(self, source: MetricSource):
+        """Register the raid command for a configured source"""
+        async def start_raid(ctx, *, targets):
+            await self.start_raid(ctx, source, targets)
+
+        command = commands.Command(
+            start_raid,
+            name=source.command,
+            help=(
+                f"Start a {source.label} raid\n\n"
+                f"Usage: !{source.command} {source.target_key}:<target> [token:<symbol>] [timeout:<minutes>]"
+            )
+        )
+        commands.has_permissions(manage_channels=True)(command)
+
+        try:
+            self.bot.add_command(command)
+            self.registered_commands.append(source.command)
+        except commands.CommandRegistrationError as e:
+            logger.error(f"Could not register command for source {source.name}: {e}")
+
+    @property
+    def default_token(self) -> Token:
+        """The first configured token is used when a command doesn't name one"""
+        return next(iter(self.tokens.values()), None)
+
+    def get_token(self, symbol=None) -> Token:
+        if symbol is None:
+            return self.default_token
+        return self.tokens.get(symbol.upper())
+
+    async def get_metrics(self, source_name, token_symbol=None, deadline=None, background=False, shared_with=()):
+        """Get the current value for a source and token via the sentiment API
+
+        deadline/background are passed to the request budget governor.
+        shared_with names other tokens the same response is recorded for."""
+        source = self.sources[source_name]
+        token = self.get_token(token_symbol)
+        try:
+            await self.budget.acquire(f"sentiment:{source.name}", deadline=deadline, background=background)
+            logger.info(f"Loading {source.label} metrics for {token.symbol}")
+            async with self.session.get(f"{self.api_url}{source.endpoint_for(token)}") as response:
+                if response.status == 200:
+                    value = float(await response.text())
+                    for symbol in (token.symbol, *shared_with):
+                        self.history.record(self.history_key(symbol, source.name), value)
+                    logger.info(f"Found {token.symbol} {source.label} {source.dashboard_label.lower()}: {source.format_value(value)}")
+                    return value
+                else:
+                    logger.error(f"API error: {response.status} - {await response.text()}")
+                    return 0
+        except Exception as e:
+            logger.error(f"Error fetching {source.label} metrics: {e}", exc_info=True)
+            return 0
+
+    async def fetch_all(self, pairs=None, deadlines=None, background=False):
+        """Fetch many (token, source) pairs in one concurrent batch
+
+        Defaults to every configured token against every source, so a full
+        refresh costs one round trip however many tokens are configured.
+        Pairs that resolve to the same endpoint (sources that aren't per_pool)
+        share a single request. deadlines optionally maps a pair to the raid
+        deadline it serves."""
+        if pairs is None:
+            pairs = [(symbol, name) for symbol in self.tokens for name in self.sources]
+        pairs = list(dict.fromkeys(pairs))
+        deadlines = deadlines or {}
+
+        groups = {}
+        for symbol, name in pairs:
+            endpoint = self.sources[name].endpoint_for(self.get_token(symbol))
+            groups.setdefault((name, endpoint), []).append((symbol, name))
+
+        async def fetch(group):
+            symbol, name = group[0]
+            deadline = min((deadlines[pair] for pair in group if deadlines.get(pair)), default=None)
+            shared_with = [other for other, _ in group[1:]]
+            return await self.get_metrics(name, symbol, deadline=deadline, background=background, shared_with=shared_with)
+
+        values = await asyncio.gather(*(fetch(group) for group in groups.values()))
+        return {pair: value for group, value in zip(groups.values(), values) for pair in group}
+
+    def history_key(self, token_symbol, source_name):
+        return f"{token_symbol}:{source_name}"
+
+    def get_series(self, token_symbol, source_name):
+        """Rolling history for a token/source pair"""
+        return self.history.get(self.history_key(token_symbol, source_name))
+
+    async def persist_history(self):
+        """Flush metric history to disk periodically so trends survive restarts"""
+        while True:
+            await asyncio.sleep(self.history_save_interval)
+            self.history.save()
+
+    def sparkline_rows(self, raid):
+        """Raid progress since it started, with the target as a dashed line"""
+        return [(raid['samples'], raid['target'], PALETTE[0])]
+
+    def raid_deadline(self, raid):
+        """Unix timestamp at which a raid times out"""
+        return raid['start_time'].timestamp() + raid['timeout'] * 60
+
+    async def create_progress_embed(self, source: MetricSource, token: Token, current_value, target_value):
+        """Create progress embed for a source raid"""
+        description = source.description
+        if len(self.tokens) > 1:
+            description += f"\nToken: **{token.symbol}**"
+
+        embed = discord.Embed(
+            title=source.title,
+            description=description,
+            color=0x00FF00
+        )
+
+        percentage = (current_value/target_value*100) if target_value > 0 else 0
+        progress_bar = self.create_progress_bar(current_value, target_value)
+
+        status_emoji = "✅" if percentage >= 100 else "🔸" if percentage >= 75 else "🔹"
+
+        embed.add_field(
+            name=source.progress_label,
+            value=(
+                f"{status_emoji} Progress: {progress_bar} {percentage:.1f}%\n"
+                f"Current: **{source.format_value(current_value)}** / Target: **{source.format_value(target_value)}**"
+            ),
+            inline=False
+        )
+
+        embed.add_field(
+            name="📝 Link",
+            value=f"[Click to vote]({source.link_for(token)})",
+            inline=False
+        )
+
+        embed.timestamp = datetime.now(timezone.utc)
+        embed.set_footer(text="Last updated")
+
+        return embed
+
+    async def start_raid(self, ctx, source: MetricSource, targets):
+        """Parse targets, lock the channel and hand the raid to the poll scheduler"""
+        if not await self.check_raid_channel(ctx):
+            return
+
+        channel_locked = False
+        try:
+            # Parse targets
+            target_value = None
+            token = self.default_token
+            timeout_minutes = 15  # Default timeout
+
+            for pair in targets.split():
+                if ':' not in pair:
+                    continue
+
+                metric, value = pair.split(':', 1)
+                metric = metric.lower()
+
+                try:
+                    if metric == 'timeout':
+                        timeout_minutes = max(1, min(120, int(float(value))))
+                    elif metric == 'token':
+                        token = self.get_token(value)
+                    elif metric == source.target_key:
+                        target_value = source.parse_target(value)
+                except ValueError:
+                    continue
+
+            if token is None:
+                await ctx.send(f"Unknown token. Configured tokens: {', '.join(self.tokens) or 'none'}")
+                return
+
+            if target_value is None:
+                await ctx.send(
+                    f"Please provide a valid target between {source.format_value(source.min_target)} "
+                    f"and {source.format_value(source.max_target)} (e.g., `{source.target_key}:<target>`)"
+                )
+                return
+
+            if not self.reserve_channel(ctx.channel.id):
+                await ctx.send("There's already an active raid in this channel!")
+                return
+
+            await self.lock_channel(ctx.channel)
+            channel_locked = True
+
+            lock_embed = discord.Embed(
+                title="🚨 CHANNEL LOCKED 🚨",
+                description=f"🔒 This channel is locked until the {source.dashboard_label.lower()} target is met! 🔒",
+                color=0xFF0000
+            )
+            lock_embed.set_footer(text="Channel will automatically unlock when target is reached")
+            lock_message = await ctx.send(content=self.raid_mention, embed=lock_embed)
+
+            current_value = await self.get_metrics(source.name, token.symbol)
+            progress_embed = await self.create_progress_embed(source, token, current_value, target_value)
+            progress_message = await ctx.send(embed=progress_embed)
+
+            self.engagement_targets[ctx.channel.id] = {
+                'source': source.name,
+                'token': token.symbol,
+                'channel': ctx.channel,
+                'target': target_value,
+                'current': current_value,
+                'samples': [current_value],
+                'start_time': datetime.now(timezone.utc),
+                'timeout': timeout_minutes,
+                'message_id': progress_message.id,
+                'lock_message_id': lock_message.id
+            }
+
+        except Exception as e:
+            logger.error(f"Error in {source.command}: {e}", exc_info=True)
+            await ctx.send(f"Error: {str(e)}")
+            if channel_locked:
+                await self.unlock_channel(ctx.channel)
+            else:
+                self.release_channel(ctx.channel.id)
+
+    async def poll_raids(self):
+        """Single scheduler for every active raid: fetch each source once per cycle"""
+        while True:
+            try:
+                if self.engagement_targets:
+                    # Each pair is fetched once, at the priority of the raid closest to timing out
+                    deadlines = {}
+                    for raid in self.engagement_targets.values():
+                        pair = (raid['token'], raid['source'])
+                        deadlines[pair] = min(deadlines.get(pair, float('inf')), self.raid_deadline(raid))
+                    current = await self.fetch_all(list(deadlines), deadlines)
+
+                    results = await asyncio.gather(
+                        *(self.update_raid(channel_id, current[(raid['token'], raid['source'])])
+                          for channel_id, raid in list(self.engagement_targets.items())),
+                        return_exceptions=True
+                    )
+                    for result in results:
+                        if isinstance(result, Exception):
+                            logger.error(f"Error monitoring raid: {result}", exc_info=result)
+
+            except Exception as e:
+                logger.error(f"Error in raid poll scheduler: {e}", exc_info=True)
+
+            await asyncio.sleep(self.poll_interval)
+
+    async def update_raid(self, channel_id, current_value):
+        """Advance a single raid with a freshly polled value"""
+        raid = self.engagement_targets.get(channel_id)
+        if not raid or not self.locked_channels.get(channel_id):
+            return
+
+        source = self.sources[raid['source']]
+        token = self.get_token(raid['token'])
+        channel = raid['channel']
+        target_value = raid['target']
+        progress_message = channel.get_partial_message(raid['message_id'])
+        lock_message = channel.get_partial_message(raid['lock_message_id'])
+
+        # Check timeout
+        if (datetime.now(timezone.utc) - raid['start_time']).total_seconds() > raid['timeout'] * 60:
+            await self.unlock_channel(channel)
+            await lock_message.delete()
+
+            timeout_embed = await self.create_progress_embed(source, token, raid['current'], target_value)
+            timeout_embed.color = 0xFF6B6B
+            timeout_embed.add_field(
+                name="⏰ RAID TIMED OUT! ⏰",
+                value=f"```diff\n- Raid ended after {raid['timeout']} minutes! Channel unlocked! 🔓\n```",
+                inline=False
+            )
+            files = await self.attach_sparkline(timeout_embed, self.sparkline_rows(raid))
+            await progress_message.edit(embed=timeout_embed, attachments=files)
+            return
+
+        raid['current'] = current_value
+        self.record_sample(raid['samples'], current_value)
+
+        # Check if target met
+        if current_value >= target_value:
+            await self.unlock_channel(channel)
+            await lock_message.delete()
+
+            final_embed = await self.create_progress_embed(source, token, current_value, target_value)
+            final_embed.add_field(
+                name="🎉 CHALLENGE COMPLETE! 🎉",
+                value="```diff\n+ Target reached! Channel unlocked! 🔓\n```",
+                inline=False
+            )
+            files = await self.attach_sparkline(final_embed, self.sparkline_rows(raid))
+            await progress_message.edit(embed=final_embed, attachments=files)
+            return
+
+        # Update progress
+        progress_embed = await self.create_progress_embed(source, token, current_value, target_value)
+        files = await self.attach_sparkline(progress_embed, self.sparkline_rows(raid))
+        await self.budget.acquire('discord', deadline=self.raid_deadline(raid))
+        await progress_message.edit(embed=progress_embed, attachments=files)
+
+async def setup(bot):
+    await bot.add_cog(MetricRaid(bot))
@@ -0,0 +1,94 @@
+import os
+from pathlib import Path
+from urllib.parse import urlencode
+from typing import Dict, Literal
+import logging
+from pydantic import BaseModel, field_validator
+
+logger = logging.getLogger('tetsuo_bot.metric_sources')
+
+class Token(BaseModel):
+    """A token/pool the bot tracks across every metric source"""
+    symbol: str
+    chain: str = "solana"
+    pool: str
+
+    @field_validator('symbol')
+    @classmethod
+    def normalize_symbol(cls, value: str) -> str:
+        return value.upper()
+
+    def template_fields(self) -> Dict[str, str]:
+        return {'symbol': self.symbol, 'chain': self.chain, 'pool': self.pool}
+
+class TokenConfig(BaseModel):
+    tokens: list[Token] = []
+
+    @classmethod
+    def load(cls) -> 'TokenConfig':
+        config_path = Path(os.getenv('TOKENS_FILE', 'tokens.json'))
+        if config_path.exists():
+            return cls.model_validate_json(config_path.read_text())
+        logger.warning(f"Token config {config_path} not found, no tokens registered")
+        return cls()
+
+class MetricSource(BaseModel):
+    """A single venue the raid and dashboard code can poll"""
+    name: str
+    label: str
+    endpoint: str
+    value_type: Literal['int', 'percent'] = 'int'
+    display_format: str = "{:,.0f}"
+    link: str
+    command: str
+    target_key: str
+    min_target: float = 1
+    max_target: float = 1000000
+    title: str = "🎯 Engagement Challenge"
+    description: str = "Help support by voting!"
+    progress_label: str = "📊 Progress"
+    dashboard_label: str = "Value"
+    change_unit: str = ""
+    per_pool: bool = False  # The API reports this source per pool via ?pool=; otherwise one value for every token
+
+    def link_for(self, token: Token) -> str:
+        """Source link with the token's chain/pool filled in"""
+        return self.link.format(**token.template_fields())
+
+    def endpoint_for(self, token: Token) -> str:
+        """API endpoint with the token's chain/pool filled in, plus ?pool= for per-pool sources"""
+        endpoint = self.endpoint.format(**token.template_fields())
+        if not self.per_pool:
+            return endpoint
+        separator = '&' if '?' in endpoint else '?'
+        return f"{endpoint}{separator}{urlencode({'pool': token.pool})}"
+
+    def format_value(self, value: float) -> str:
+        """Render a value using the configured display format"""
+        return self.display_format.format(value)
+
+    def parse_target(self, raw: str) -> float:
+        """Parse a raw target string, raising ValueError if it is out of range"""
+        value = int(raw) if self.value_type == 'int' else float(raw)
+        if not self.min_target <= value <= self.max_target:
+            raise ValueError(f"{self.target_key} must be between {self.min_target:g} and {self.max_target:g}")
+        return value
+
+class MetricSourceConfig(BaseModel):
+    sources: list[MetricSource] = []
+
+    @classmethod
+    def load(cls) -> 'MetricSourceConfig':
+        config_path = Path(os.getenv('METRIC_SOURCES_FILE', 'metric_sources.json'))
+        if config_path.exists():
+            return cls.model_validate_json(config_path.read_text())
+        logger.warning(f"Metric source config {config_path} not found, no sources registered")
+        return cls()
+
+def load_metric_sources() -> Dict[str, MetricSource]:
+    """Load configured metric sources keyed by name"""
+    return {source.name: source for source in MetricSourceConfig.load().sources}
+
+def load_tokens() -> Dict[str, Token]:
+    """Load configured tokens keyed by symbol, in config order"""
+    return {token.symbol: token for token in TokenConfig.load().tokens}
@@ -0,0 +1,167 @@
+import os
+import time
+import heapq
+import asyncio
+import itertools
+from functools import lru_cache
+from typing import Dict, Optional
+import logging
+
+logger = logging.getLogger('tetsuo_bot.request_budget')
+
+# Hourly quota and burst size per upstream family. Per-source upstreams such as
+# "sentiment:cmc" get their own bucket sized from the family defaults.
+DEFAULT_LIMITS = {
+    'twitter': (600, 20),
+    'sentiment': (1200, 30),
+    'telegram': (1800, 30),
+    'telegram_chat': (1200, 20),  # Per chat, as "telegram_chat:<chat_id>"; Telegram allows ~20 messages a minute per group
+    'discord': (3600, 60),
+}
+
+# Background consumers may only spend tokens above this fraction of capacity,
+# so they back off first when an upstream gets tight.
+BACKGROUND_RESERVE = 0.25
+
+class TokenBucket:
+    """Classic token bucket refilled continuously at rate_per_hour"""
+
+    def __init__(self, rate_per_hour: float, capacity: float):
+        self.rate = rate_per_hour / 3600
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_take(self, floor: float = 0) -> bool:
+        """Take one token if doing so keeps at least `floor` tokens in the bucket"""
+        self.refill()
+        if self.tokens - 1 >= floor:
+            self.tokens -= 1
+            return True
+        return False
+
+    def time_until(self, floor: float = 0) -> float:
+        """Seconds until a token can be taken without dipping below `floor`"""
+        self.refill()
+        missing = floor + 1 - self.tokens
+        return max(missing / self.rate, 0) if self.rate > 0 else 60
+
+class BudgetLane:
+    """A bucket plus the priority queue of callers waiting on it"""
+
+    def __init__(self, name: str, rate_per_hour: float, capacity: float):
+        self.name = name
+        self.bucket = TokenBucket(rate_per_hour, capacity)
+        self.reserve = capacity * BACKGROUND_RESERVE
+        self.waiters = []
+        self.condition = asyncio.Condition()
+        self.granted = 0
+        self.waited = 0.0
+
+class RequestBudget:
+    """Central governor handing out request permits per upstream.
+
+    Callers are served in priority order: raids by nearest deadline, then
+    regular callers, then background work (dashboard, cleanup) which is only
+    allowed to spend the part of the bucket above the reserve."""
+
+    RAID, NORMAL, BACKGROUND = range(3)
+
+    def __init__(self, limits: Dict[str, tuple] = None):
+        self.limits = dict(limits or DEFAULT_LIMITS)
+        self.lanes: Dict[str, BudgetLane] = {}
+        self._sequence = itertools.count()
+
+    def get_lane(self, upstream: str) -> Optional[BudgetLane]:
+        if upstream not in self.lanes:
+            family = upstream.split(':', 1)[0]
+            if family not in self.limits:
+                return None
+            rate, burst = self.limits[family]
+            self.lanes[upstream] = BudgetLane(upstream, rate, burst)
+        return self.lanes[upstream]
+
+    async def acquire(self, upstream: str, deadline: float = None, background: bool = False):
+        """Wait for a permit to call `upstream`
+
+        deadline: unix timestamp the caller must finish by (active raids)
+        background: low-priority work that should yield when the budget is tight"""
+        lane = self.get_lane(upstream)
+        if lane is None:
+            return
+
+        if deadline is not None:
+            priority = (self.RAID, deadline)
+        else:
+            priority = (self.BACKGROUND if background else self.NORMAL, 0)
+        entry = (priority, next(self._sequence))
+        floor = lane.reserve if background else 0
+        started = time.monotonic()
+
+        async with lane.condition:
+            heapq.heappush(lane.waiters, entry)
+            try:
+                while True:
+                    timeout = None
+                    if lane.waiters[0] == entry:
+                        if lane.bucket.try_take(floor):
+                            heapq.heappop(lane.waiters)
+                            lane.granted += 1
+                            lane.waited += time.monotonic() - started
+                            lane.condition.notify_all()
+                            return
+                        timeout = lane.bucket.time_until(floor)
+
+                    try:
+                        await asyncio.wait_for(lane.condition.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+            except BaseException:
+                if entry in lane.waiters:
+                    lane.waiters.remove(entry)
+                    heapq.heapify(lane.waiters)
+                    lane.condition.notify_all()
+                raise
+
+    def pressure(self, upstream: str) -> float:
+        """Fraction of the bucket currently spent (0 = idle, 1 = exhausted)"""
+        lane = self.get_lane(upstream)
+        if lane is None:
+            return 0.0
+        lane.bucket.refill()
+        return 1 - lane.bucket.tokens / lane.bucket.capacity
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Current state of every lane, for status commands and logging"""
+        state = {}
+        for name, lane in sorted(self.lanes.items()):
+            lane.bucket.refill()
+            state[name] = {
+                'tokens': lane.bucket.tokens,
+                'capacity': lane.bucket.capacity,
+                'waiting': len(lane.waiters),
+                'granted': lane.granted,
+                'avg_wait': lane.waited / lane.granted if lane.granted else 0.0,
+            }
+        return state
+
+def load_limits() -> Dict[str, tuple]:
+    """Default limits, overridable per family via BUDGET_<FAMILY>_PER_HOUR / _BURST"""
+    limits = {}
+    for family, (rate, burst) in DEFAULT_LIMITS.items():
+        prefix = f"BUDGET_{family.upper()}"
+        limits[family] = (
+            float(os.getenv(f"{prefix}_PER_HOUR", rate)),
+            float(os.getenv(f"{prefix}_BURST", burst))
+        )
+    return limits
+
+@lru_cache()
+def get_request_budget() -> RequestBudget:
+    """Get the shared budget governor"""
+    return RequestBudget(load_limits())
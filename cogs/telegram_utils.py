@@ -1,74 +1,204 @@
-from telegram.ext import ApplicationBuilder
-from telegram import ChatPermissions
+import asyncio
+import json
+import os
+import time
+from telegram import Bot, ChatPermissions, LinkPreviewOptions
+from telegram.request import HTTPXRequest
 from telegram import error as telegram_error
 import logging
+from typing import Union
+from .request_budget import get_request_budget
 
 logger = logging.getLogger('tetsuo_bot.telegram_utils')
 
+RAID_ANIMATION_URL = "https://media.tenor.com/kEtaKa93XxIAAAPo/malks.mp4"
+
+class TelegramChat:
+    """Raid state for one Telegram chat"""
+
+    def __init__(self, chat_id: str):
+        self.chat_id = chat_id
+        self.message_id = None  # Current raid message
+        self.locked = False
+
 class TelegramMessenger:
-    def __init__(self, bot_token: str, chat_id: str):
+    def __init__(self, bot_token: str, chat_ids: Union[str, list, None], pool_size: int = 8):
         self.bot_token = bot_token
-        self.chat_id = chat_id
-        self.app = None
-        self.current_message_id = None
+        if isinstance(chat_ids, str) or chat_ids is None:
+            chat_ids = (chat_ids or '').split(',')
+        self.chats = {
+            chat_id: TelegramChat(chat_id)
+            for chat_id in (str(chat_id).strip() for chat_id in chat_ids) if chat_id
+        }
+        self.pool_size = pool_size
+        self.bot = None  # Connected lazily on the first call
+        self.connect_lock = asyncio.Lock()
+        self.budget = get_request_budget()
+        self.stats = {
+            'connects': 0, 'failed_connects': 0, 'connect_seconds': 0.0,
+            'requests': 0, 'request_seconds': 0.0, 'first_request_seconds': None,
+            'media_hits': 0, 'media_uploads': 0,
+        }
+        # Media URL -> Telegram file_id, so files are uploaded once rather than on every raid
+        self.media_file = 'telegram_media.json'
+        self.media_ids = {}
+        self.load_media_ids()
+
+    def load_media_ids(self):
+        try:
+            if os.path.exists(self.media_file):
+                with open(self.media_file, 'r') as f:
+                    self.media_ids = json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading Telegram media cache: {e}", exc_info=True)
+            self.media_ids = {}
+
+    def save_media_ids(self):
+        try:
+            with open(self.media_file, 'w') as f:
+                json.dump(self.media_ids, f, indent=2)
+        except Exception as e:
+            logger.error(f"Error saving Telegram media cache: {e}", exc_info=True)
 
     async def initialize(self):
-        """Initialize Telegram bot"""
-        if not self.app:
-            try:
-                self.app = ApplicationBuilder().token(self.bot_token).build()
-                await self.app.initialize()
-                await self.app.start()
-                logger.info("Telegram bot ready")
+        """Connect a bare Bot client; its HTTP connection pool is reused for every call"""
+        if self.bot:
+            return True
+        async with self.connect_lock:
+            if self.bot:
                 return True
+            started = time.monotonic()
+            try:
+                bot = Bot(self.bot_token, request=HTTPXRequest(connection_pool_size=self.pool_size))
+                await bot.initialize()
             except Exception as e:
+                self.stats['failed_connects'] += 1
                 logger.error(f"Failed to initialize Telegram bot: {e}", exc_info=True)
                 return False
-        return True
+            self.bot = bot
+            elapsed = time.monotonic() - started
+            self.stats['connects'] += 1
+            self.stats['connect_seconds'] += elapsed
+            logger.info(f"Telegram bot ready in {elapsed:.2f}s")
+            return True
 
     async def cleanup(self):
         """Cleanup Telegram bot"""
-        if self.app:
-            await self.app.stop()
-            await self.app.shutdown()
-            self.app = None
+        if self.bot:
+            await self.bot.shutdown()
+            self.bot = None
             logger.info("Telegram bot stopped")
 
-    async def lock_chat(self):
-        """Lock the chat"""
+    async def request(self, method: str, chat: TelegramChat, **kwargs):
+        """Call a Bot API method for a chat, connecting first if needed"""
+        if not await self.initialize():
+            raise telegram_error.NetworkError("Telegram bot is not initialized")
+        # The chat's own bucket, then the bot-wide one
+        await self.budget.acquire(f'telegram_chat:{chat.chat_id}')
+        await self.budget.acquire('telegram')
+        started = time.monotonic()
         try:
-            if not self.app:
-                await self.initialize()
-            await self.app.bot.set_chat_permissions(
-                chat_id=self.chat_id,
-                permissions=ChatPermissions(can_send_messages=False)
-            )
-            logger.info("Telegram chat locked")
-        except Exception as e:
-            logger.error(f"Failed to lock Telegram chat: {e}")
+            return await getattr(self.bot, method)(chat_id=chat.chat_id, **kwargs)
+        finally:
+            elapsed = time.monotonic() - started
+            if self.stats['first_request_seconds'] is None:
+                self.stats['first_request_seconds'] = elapsed
+            self.stats['requests'] += 1
+            self.stats['request_seconds'] += elapsed
+
+    def summary(self) -> dict:
+        stats = self.stats
+        # Later requests reuse pooled connections, so their average should sit well below the first
+        warm = stats['requests'] - 1
+        return {
+            'connected': self.bot is not None,
+            'chats': len(self.chats),
+            'locked': sum(chat.locked for chat in self.chats.values()),
+            'connects': stats['connects'],
+            'failed_connects': stats['failed_connects'],
+            'avg_connect': stats['connect_seconds'] / stats['connects'] if stats['connects'] else 0.0,
+            'requests': stats['requests'],
+            'requests_per_connect': stats['requests'] / stats['connects'] if stats['connects'] else 0.0,
+            'first_request': stats['first_request_seconds'] or 0.0,
+            'avg_warm_request': (stats['request_seconds'] - (stats['first_request_seconds'] or 0.0)) / warm if warm > 0 else 0.0,
+            'media_hits': stats['media_hits'],
+            'media_uploads': stats['media_uploads'],
+        }
+
+    async def broadcast(self, action, description: str, chats: list = None) -> dict:
+        """Run action(chat) for every chat concurrently; a failing chat never blocks the others"""
+        chats = list(self.chats.values()) if chats is None else chats
+        results = await asyncio.gather(*(action(chat) for chat in chats), return_exceptions=True)
+        for chat, result in zip(chats, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to {description} in Telegram chat {chat.chat_id}: {result}")
+        return {chat.chat_id: result for chat, result in zip(chats, results)}
+
+    async def send_animation(self, chat: TelegramChat, url: str, **kwargs):
+        """Send an animation by cached file_id, uploading from the URL only when there is none"""
+        file_id = self.media_ids.get(url)
+        if file_id:
+            try:
+                sent = await self.request('send_animation', chat, animation=file_id, **kwargs)
+                self.stats['media_hits'] += 1
+                return sent
+            except telegram_error.BadRequest as e:
+                if 'file' not in str(e).lower():
+                    raise  # Not about the file_id, e.g. the chat is gone
+                # Expired or foreign file_id: forget it and upload again
+                logger.warning(f"Cached Telegram file_id rejected ({e}), re-sending from URL")
+                self.media_ids.pop(url, None)
+                self.save_media_ids()
+
+        sent = await self.request('send_animation', chat, animation=url, **kwargs)
+        self.stats['media_uploads'] += 1
+        media = sent.animation or sent.document or sent.video
+        if media:
+            self.media_ids[url] = media.file_id
+            self.save_media_ids()
+        return sent
+
+    async def set_locked(self, chat: TelegramChat, locked: bool):
+        await self.request('set_chat_permissions', chat, permissions=ChatPermissions(can_send_messages=not locked))
+        chat.locked = locked
+        logger.info(f"Telegram chat {chat.chat_id} {'locked' if locked else 'unlocked'}")
+
+    async def lock_chat(self):
+        """Lock every chat"""
+        await self.broadcast(lambda chat: self.set_locked(chat, True), "lock chat")
 
     async def unlock_chat(self):
-        """Unlock the chat"""
-        try:
-            if not self.app:
-                await self.initialize()
-            await self.app.bot.set_chat_permissions(
-                chat_id=self.chat_id,
-                permissions=ChatPermissions(can_send_messages=True)
-            )
-            logger.info("Telegram chat unlocked")
-        except Exception as e:
-            logger.error(f"Failed to unlock Telegram chat: {e}")
+        """Unlock every chat"""
+        await self.broadcast(lambda chat: self.set_locked(chat, False), "unlock chat")
 
-    async def delete_message(self, message_id: int):
-        """Delete a message by its ID"""
-        try:
-            if not self.app:
-                await self.initialize()
-            await self.app.bot.delete_message(chat_id=self.chat_id, message_id=message_id)
-            logger.info(f"Telegram message {message_id} deleted")
-        except Exception as e:
-            logger.error(f"Error deleting Telegram message {message_id}: {e}", exc_info=True)
+    async def delete_raid_messages(self):
+        """Delete the current raid message in every chat that has one"""
+        async def delete(chat: TelegramChat):
+            # Cleared only once the message is known to be gone, so a failed delete can be retried
+            message_id = chat.message_id
+            try:
+                await self.request('delete_message', chat, message_id=message_id)
+                logger.info(f"Telegram message {message_id} deleted in chat {chat.chat_id}")
+            except telegram_error.BadRequest as e:
+                error = str(e).lower()
+                if "message to delete not found" not in error and "message not found" not in error:
+                    raise
+                logger.debug(f"Message {message_id} already gone in chat {chat.chat_id}. Clearing message ID.")
+            if chat.message_id == message_id:
+                # A new raid may have posted its message meanwhile
+                chat.message_id = None
+
+        await self.broadcast(delete, "delete raid message", [chat for chat in self.chats.values() if chat.message_id])
+
+    async def send_message(self, text: str, chat: TelegramChat, parse_mode: str = 'HTML'):
+        """Send a text message without link previews; errors propagate so callers can retry"""
+        return await self.request(
+            'send_message',
+            chat,
+            text=text,
+            parse_mode=parse_mode,
+            link_preview_options=LinkPreviewOptions(is_disabled=True)
+        )
 
     def create_progress_message(self, metrics: dict, targets: dict) -> str:
         """Create formatted progress message"""
@@ -91,80 +221,54 @@ class TelegramMessenger:
         return f"{header}\n\n" + "\n".join(progress_bars)
     
     async def send_raid_message(self, tweet_url: str, targets: dict, metrics: dict = None):
-        """Send initial raid message with GIF"""
-        try:
-            if not self.app:
-                await self.initialize()
+        """Send the raid message with GIF to every chat; raises only if no chat got it"""
+        progress_text = self.create_progress_message(metrics or {}, targets)
+        message = f"{progress_text}\n\n{tweet_url}"
 
-            # Create progress message
-            progress_text = self.create_progress_message(metrics or {}, targets)
-            message = f"{progress_text}\n\n{tweet_url}"
+        async def send(chat: TelegramChat):
+            sent = await self.send_animation(chat, RAID_ANIMATION_URL, caption=message)
+            chat.message_id = sent.message_id
+            logger.info(f"Telegram raid message sent to {chat.chat_id}. Message ID: {sent.message_id}")
+            return sent
 
-            try:
-                # Send with raid GIF
-                sent = await self.app.bot.send_animation(
-                    chat_id=self.chat_id,
-                    animation="https://media.tenor.com/kEtaKa93XxIAAAPo/malks.mp4",
-                    caption=message
-                )
-                
-                # Detailed logging of message ID
-                logger.info(f"Telegram raid message sent. Message ID: {sent.message_id}")
-                self.current_message_id = sent.message_id
-                
-                # Additional logging of current state
-                logger.debug(f"Current message ID after sending: {self.current_message_id}")
-                
-                return sent
-            
-            except Exception as e:
-                logger.error(f"Error sending animation message: {e}", exc_info=True)
-                raise
-        
-        except Exception as e:
-            logger.error(f"Failed to send Telegram raid message: {e}", exc_info=True)
-            raise
+        chats = list(self.chats.values())
+        results = {}
+        if chats and RAID_ANIMATION_URL not in self.media_ids:
+            # Upload once, so the other chats can send the new file_id
+            results.update(await self.broadcast(send, "send raid message", chats[:1]))
+            chats = chats[1:]
+        results.update(await self.broadcast(send, "send raid message", chats))
+
+        if results and all(isinstance(result, Exception) for result in results.values()):
+            raise next(iter(results.values()))
+        return results
 
     async def update_progress(self, current_metrics: dict, targets: dict, tweet_url: str):
-        # Log the current message ID at the start of the method
-        logger.debug(f"Attempting to update Telegram progress. Current Message ID: {self.current_message_id}")
-        
-        if not self.current_message_id:
+        """Edit the raid message in every chat that has one"""
+        chats = [chat for chat in self.chats.values() if chat.message_id]
+        if not chats:
             logger.warning("No current message ID available for Telegram progress update")
             return
 
-        try:
-            progress_text = self.create_progress_message(current_metrics, targets)
-            message = f"{progress_text}\n\n{tweet_url}"
+        progress_text = self.create_progress_message(current_metrics, targets)
+        message = f"{progress_text}\n\n{tweet_url}"
 
+        async def edit(chat: TelegramChat):
             try:
-                await self.app.bot.edit_message_caption(
-                    chat_id=self.chat_id,
-                    message_id=self.current_message_id,
-                    caption=message
-                )
-                
-                # Log successful update
-                logger.info(f"Successfully updated Telegram message. Message ID: {self.current_message_id}")
-            
+                await self.request('edit_message_caption', chat, message_id=chat.message_id, caption=message)
+                logger.info(f"Successfully updated Telegram message {chat.message_id} in chat {chat.chat_id}")
+                return True
             except telegram_error.BadRequest as e:
                 if "message is not modified" in str(e).lower():
                     # This is normal - message hasn't changed
                     logger.debug("Telegram message unchanged - skipping update")
-                    return True  # Return success since this is expected behavior
+                    return True
                 elif "message not found" in str(e).lower():
-                    # Log if message seems to have disappeared
-                    logger.debug(f"Message with ID {self.current_message_id} not found. Clearing current message ID.")
-                    self.current_message_id = None
-                    return False
-                else:
-                    # Log any other BadRequest errors
-                    logger.debug(f"Unexpected BadRequest error updating Telegram message: {e}")
+                    logger.debug(f"Message {chat.message_id} not found in chat {chat.chat_id}. Clearing message ID.")
+                    chat.message_id = None
                     return False
-            except Exception as e:
-                # Log any other unexpected errors
-                logger.error(f"Unexpected error updating Telegram message: {e}")
+                logger.debug(f"Unexpected BadRequest error updating Telegram message: {e}")
                 return False
-                
-        except Exception as e:
-            logger.error(f"Failed to update Telegram progress: {e}")
\ No newline at end of file
+
+        results = await self.broadcast(edit, "update raid progress", chats)
+        return any(result is True for result in results.values())
@@ -11,6 +11,9 @@ import re
 import json
 import random
 from .scrape_utils import ScrapeUtils
+from .request_budget import get_request_budget
+from .message_registry import get_message_registry
+from .charts import PALETTE
 import logging
 logger = logging.getLogger('tetsuo_bot.twitter_raid')
 
@@ -21,21 +24,21 @@ class TwitterRaid(BaseRaid):
         super().__init__(bot)
         self.browser = None
         self.raid_history = []
+        self.budget = get_request_budget()
+        self.registry = get_message_registry()
         self.history_file = 'raid_history.json'
         self.load_raid_history()
         self.raid_channel_id = int(os.getenv('RAID_CHANNEL_ID', 0)) or None
+        # TELEGRAM_CHAT_IDS mirrors raids to several groups; TELEGRAM_CHAT_ID still works for one
         self.telegram = TelegramMessenger(
             os.getenv('TELEGRAM_BOT_TOKEN'),
-            os.getenv('TELEGRAM_CHAT_ID')
+            os.getenv('TELEGRAM_CHAT_IDS') or os.getenv('TELEGRAM_CHAT_ID')
         )
     
     async def setup_initial(self):
-        """Initialize both Playwright and Telegram when cog is loaded"""
+        """Initialize Playwright when cog is loaded; Telegram connects on first use"""
         try:
             await self.setup_playwright()
-            if not await self.telegram.initialize():
-                logger.error("Failed to initialize Telegram")
-                return False
             logger.info("TwitterRaid: All components initialized successfully")
             return True
         except Exception as e:
@@ -104,18 +107,27 @@ class TwitterRaid(BaseRaid):
         if not channel:
             return
 
-        # Find existing pinned summary or None
+        # Registered summary first; only scan pins if we have never seen it
         existing_summary = None
-        pins = await channel.pins()
-        for message in pins:
-            if message.author == self.bot.user and "RAID PERFORMANCE SUMMARY" in message.content:
-                existing_summary = message
-                break
+        summary_id = self.registry.get(channel.id, 'raid_summary')
+        if summary_id:
+            existing_summary = channel.get_partial_message(summary_id)
+        else:
+            pins = await channel.pins()
+            for message in pins:
+                if message.author == self.bot.user and "RAID PERFORMANCE SUMMARY" in message.content:
+                    existing_summary = message
+                    self.registry.set(channel.id, 'raid_summary', message.id)
+                    break
 
         # Get raids from last 24h
         if not self.raid_history:
             if existing_summary:
-                await existing_summary.delete()
+                try:
+                    await existing_summary.delete()
+                except discord.NotFound:
+                    pass
+                self.registry.remove(channel.id, 'raid_summary')
             return
 
         # Calculate statistics
@@ -157,10 +169,14 @@ class TwitterRaid(BaseRaid):
         # Update or create pinned message
         try:
             if existing_summary:
-                await existing_summary.edit(content=summary)
+                try:
+                    await existing_summary.edit(content=summary)
+                except discord.NotFound:
+                    # Registered summary was deleted; post a fresh one
+                    existing_summary = None
+                    await self.send_raid_summary(channel, summary)
             else:
-                new_summary = await channel.send(summary)
-                await new_summary.pin()
+                await self.send_raid_summary(channel, summary)
         except discord.errors.HTTPException as e:
             logger.error(f"Failed to update raid summary (len={len(summary)}): {e}")
             # Fallback to a more compact format if still too long
@@ -173,8 +189,12 @@ class TwitterRaid(BaseRaid):
                 if existing_summary:
                     await existing_summary.edit(content=compact_summary)
                 else:
-                    new_summary = await channel.send(compact_summary)
-                    await new_summary.pin()
+                    await self.send_raid_summary(channel, compact_summary)
+
+    async def send_raid_summary(self, channel, summary):
+        new_summary = await channel.send(summary)
+        await new_summary.pin()
+        self.registry.set(channel.id, 'raid_summary', new_summary.id)
 
     def format_time_ago(self, timestamp):
         delta = datetime.now(timezone.utc) - timestamp
@@ -209,8 +229,10 @@ class TwitterRaid(BaseRaid):
             logger.error(f"Error initializing Playwright: {e}", exc_info=True)
             raise e
 
-    async def get_tweet_metrics(self, tweet_url):
+    async def get_tweet_metrics(self, tweet_url, deadline=None):
         logger.info(f"Fetching metrics for tweet: {tweet_url}")
+        # Scrapes count against the hourly twitter budget; raids pass their deadline for priority
+        await self.budget.acquire('twitter', deadline=deadline)
         tweet_url = tweet_url.replace('x.com', 'twitter.com')
         
         if not self.browser:
@@ -367,6 +389,7 @@ class TwitterRaid(BaseRaid):
             return
         logger.debug(f"raid called with url: {tweet_url} and targets: {targets}")
         
+        reserved = channel_locked = telegram_locked = False
         try:
             # Clean and validate tweet URL
             tweet_url = re.match(r'^https?://(twitter\.com|x\.com)/\w+/status/\d+', tweet_url)
@@ -412,9 +435,10 @@ class TwitterRaid(BaseRaid):
                 await ctx.send("Please provide valid targets (e.g., `likes:100 retweets:50`)")
                 return
             
-            if ctx.channel.id in self.locked_channels:
+            if not self.reserve_channel(ctx.channel.id):
                 await ctx.send("There's already an active raid in this channel!")
                 return
+            reserved = True
             
             # Get initial metrics once
             initial_metrics = await self.get_tweet_metrics(tweet_url)
@@ -423,8 +447,7 @@ class TwitterRaid(BaseRaid):
             overwrites = ctx.channel.overwrites_for(ctx.guild.default_role)
             overwrites.send_messages = False
             await ctx.channel.set_permissions(ctx.guild.default_role, overwrite=overwrites)
-            
-            self.locked_channels[ctx.channel.id] = True
+            channel_locked = True
             
             # Send initial lock message
             lock_embed = discord.Embed(
@@ -440,6 +463,7 @@ class TwitterRaid(BaseRaid):
             challenge_message = await ctx.send(embed=embed)
 
             # Send initial Telegram message with metrics
+            telegram_locked = True
             await self.telegram.lock_chat()
             await self.telegram.send_raid_message(tweet_url, target_dict, initial_metrics)
             
@@ -450,8 +474,10 @@ class TwitterRaid(BaseRaid):
                 'last_update': datetime.now(timezone.utc),
                 'message_id': challenge_message.id,
                 'lock_message_id': lock_message.id,
-                'timeout': timeout_minutes
+                'timeout': timeout_minutes,
+                'samples': {}
             }
+            self.record_samples(self.engagement_targets[ctx.channel.id], initial_metrics)
             
             # Start monitoring
             self.bot.loop.create_task(self.monitor_engagement(ctx.channel, tweet_url, target_dict, timeout_minutes))
@@ -459,6 +485,23 @@ class TwitterRaid(BaseRaid):
         except Exception as e:
             logger.error(f"Error in start_engagement: {e}", exc_info=True)
             await ctx.send(f"Error: {str(e)}")
+            if channel_locked:
+                await self.unlock_channel(ctx.channel)
+            elif reserved:
+                self.release_channel(ctx.channel.id)
+            if telegram_locked:
+                await self.telegram.unlock_chat()
+
+    def record_samples(self, challenge, metrics):
+        for metric in challenge['targets']:
+            self.record_sample(challenge['samples'].setdefault(metric, []), metrics.get(metric, 0))
+
+    def sparkline_rows(self, challenge):
+        """One row per target, in the same order as the embed fields"""
+        return [
+            (challenge['samples'].get(metric, []), target, PALETTE[index % len(PALETTE)])
+            for index, (metric, target) in enumerate(challenge['targets'].items())
+        ]
 
     async def create_progress_embed(self, tweet_url, targets, metrics=None):
         if not metrics:
@@ -508,9 +551,10 @@ class TwitterRaid(BaseRaid):
 
     async def monitor_engagement(self, channel, tweet_url, targets, timeout_minutes):
         start_time = datetime.now(timezone.utc)
+        deadline = start_time.timestamp() + timeout_minutes * 60
         logger.debug(f"Raid started at {start_time} with {timeout_minutes} minute timeout")
         # Get initial metrics
-        metrics = await self.get_tweet_metrics(tweet_url)
+        metrics = await self.get_tweet_metrics(tweet_url, deadline)
 
         while self.locked_channels.get(channel.id):
             try:
@@ -555,7 +599,8 @@ class TwitterRaid(BaseRaid):
                                 logger.debug("Lock message already deleted")
 
                             message = await channel.fetch_message(challenge_data['message_id'])
-                            metrics = await self.get_tweet_metrics(tweet_url)
+                            metrics = await self.get_tweet_metrics(tweet_url, deadline)
+                            self.record_samples(challenge_data, metrics)
                             
                             # Create timeout embed
                             timeout_embed = await self.create_progress_embed(tweet_url, targets, metrics)
@@ -573,7 +618,8 @@ class TwitterRaid(BaseRaid):
                                 inline=False
                             )
                             
-                            await message.edit(embed=timeout_embed)
+                            files = await self.attach_sparkline(timeout_embed, self.sparkline_rows(challenge_data))
+                            await message.edit(embed=timeout_embed, attachments=files)
                         except:
                             logger.warning("Could not find original message for timeout update")
                     
@@ -581,7 +627,7 @@ class TwitterRaid(BaseRaid):
                     del self.engagement_targets[channel.id]
                     return
 
-                metrics = await self.get_tweet_metrics(tweet_url)
+                metrics = await self.get_tweet_metrics(tweet_url, deadline)
                 
                 challenge_data = self.engagement_targets.get(channel.id)
                 if not challenge_data:
@@ -593,6 +639,7 @@ class TwitterRaid(BaseRaid):
                     continue
                 
                 challenge_data['last_update'] = datetime.now(timezone.utc)
+                self.record_samples(challenge_data, metrics)
                 
                 # Get the original message
                 try:
@@ -655,7 +702,8 @@ class TwitterRaid(BaseRaid):
                         inline=False
                     )
                     
-                    await message.edit(embed=final_embed)
+                    files = await self.attach_sparkline(final_embed, self.sparkline_rows(challenge_data))
+                    await message.edit(embed=final_embed, attachments=files)
                     
                     del self.locked_channels[channel.id]
                     del self.engagement_targets[channel.id]
@@ -663,7 +711,8 @@ class TwitterRaid(BaseRaid):
                 else:
                     # Update progress
                     embed = await self.create_progress_embed(tweet_url, targets, metrics)
-                    await message.edit(embed=embed)
+                    files = await self.attach_sparkline(embed, self.sparkline_rows(challenge_data))
+                    await message.edit(embed=embed, attachments=files)
                     
                     # Update Telegram progress
                     await self.telegram.update_progress(metrics, targets, tweet_url)
@@ -674,10 +723,6 @@ class TwitterRaid(BaseRaid):
             
             await ScrapeUtils.random_delay(30)  # 30 seconds base with jitter
 
-    def cog_unload(self):
-        if self.browser:
-            asyncio.create_task(self.browser.close())
-
 async def setup(bot):
     cog = TwitterRaid(bot)
     if not await cog.setup_initial():  # Add this method
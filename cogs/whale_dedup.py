@@ -0,0 +1,80 @@
+import os
+import json
+import time
+from collections import OrderedDict
+from pathlib import Path
+import logging
+
+logger = logging.getLogger('tetsuo_bot.whale_dedup')
+
+class RecentHashes:
+    """Bounded LRU of recently alerted transaction hashes with a time horizon
+
+    Persisted to JSON so events replayed by the feed after a reconnect or a
+    restart are recognised and dropped."""
+
+    def __init__(self, path: str, max_size: int = 10000, ttl: float = 24 * 60 * 60):
+        self.path = Path(path)
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hashes: OrderedDict[str, float] = OrderedDict()  # hash -> first seen, oldest first
+        self.hits = 0
+        self.dirty = False
+
+    def _expire(self, now: float):
+        while self.hashes:
+            seen_at = next(iter(self.hashes.values()))
+            if seen_at > now - self.ttl and len(self.hashes) <= self.max_size:
+                break
+            self.hashes.popitem(last=False)
+            self.dirty = True
+
+    def seen(self, tx_hash: str) -> bool:
+        """True if the hash was already alerted (a duplicate); does not remember it"""
+        self._expire(time.time())
+        if tx_hash in self.hashes:
+            self.hits += 1
+            return True
+        return False
+
+    def add(self, tx_hash: str):
+        """Remember a hash once its alert has been accepted"""
+        now = time.time()
+        self.hashes.setdefault(tx_hash, now)
+        self.dirty = True
+        self._expire(now)
+
+    def discard(self, tx_hash: str):
+        """Forget a hash whose alert was dropped, so a replay can still deliver it"""
+        if self.hashes.pop(tx_hash, None) is not None:
+            self.dirty = True
+
+    def check_and_add(self, tx_hash: str) -> bool:
+        """True if the hash was already seen (a duplicate); otherwise remember it"""
+        if self.seen(tx_hash):
+            return True
+        self.add(tx_hash)
+        return False
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def load(self):
+        try:
+            if self.path.exists():
+                self.hashes = OrderedDict(sorted(json.loads(self.path.read_text()).items(), key=lambda item: item[1]))
+                self._expire(time.time())
+        except Exception as e:
+            logger.error(f"Error loading whale dedup index: {e}", exc_info=True)
+            self.hashes = OrderedDict()
+
+    def save(self):
+        if not self.dirty:
+            return
+        try:
+            tmp_path = self.path.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps(self.hashes))
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except Exception as e:
+            logger.error(f"Error saving whale dedup index: {e}", exc_info=True)
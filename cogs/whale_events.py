@@ -0,0 +1,112 @@
+from datetime import datetime, timezone
+from typing import Optional, Union
+from pydantic import AliasChoices, BaseModel, Field, field_validator
+
+# Models are validated straight from the raw frame with pydantic-core's JSON
+# parser; unknown fields are skipped without building Python objects.
+
+TOKEN_ALIASES = AliasChoices('token', 'token_symbol', 'symbol')
+WALLET_ALIASES = AliasChoices('wallet', 'wallet_address', 'buyer')
+
+def as_utc(value: datetime) -> datetime:
+    """Feed timestamps without an offset are UTC, never local time"""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+class WhaleTransaction(BaseModel):
+    transaction_hash: str
+    amount_usd: float
+    price_usd: float = 0
+    amount_tokens: float = 0
+    wallet: Optional[str] = Field(None, validation_alias=WALLET_ALIASES)
+    token: Optional[str] = Field(None, validation_alias=TOKEN_ALIASES)
+
+class TokenStats(BaseModel):
+    volume_24h: Optional[float] = None
+    market_cap: Optional[float] = None
+    price_usd: Optional[float] = None
+
+class AlertImage(BaseModel):
+    url: Optional[str] = None
+
+class AlertStyle(BaseModel):
+    title: str
+    color: int
+    timestamp: datetime
+    image: Optional[AlertImage] = None
+
+    @field_validator('timestamp')
+    @classmethod
+    def normalize_timestamp(cls, value: datetime) -> datetime:
+        return as_utc(value)
+
+class WhaleAlert(BaseModel):
+    """Payload of a new_whale event"""
+    transaction: WhaleTransaction
+    alert: AlertStyle
+    token_stats: TokenStats = TokenStats()
+
+class WhaleEvent(BaseModel):
+    event_type: str
+    data: Optional[WhaleAlert] = None
+
+class _ProbeTransaction(BaseModel):
+    amount_usd: float = 0
+    transaction_hash: Optional[str] = None
+    token: Optional[str] = Field(None, validation_alias=TOKEN_ALIASES)
+    wallet: Optional[str] = Field(None, validation_alias=WALLET_ALIASES)
+
+class _ProbeAlert(BaseModel):
+    timestamp: Optional[str] = None
+
+    @property
+    def epoch(self) -> Optional[float]:
+        """The timestamp as unix time, read the same way as AlertStyle.timestamp"""
+        if not self.timestamp:
+            return None
+        try:
+            return as_utc(datetime.fromisoformat(self.timestamp)).timestamp()
+        except ValueError:
+            return None
+
+class _ProbeData(BaseModel):
+    transaction: Optional[_ProbeTransaction] = None
+    alert: Optional[_ProbeAlert] = None
+
+class WhaleEventProbe(BaseModel):
+    """Just enough of an event to decide whether it is worth decoding fully"""
+    event_type: Optional[str] = None
+    cursor: Optional[Union[int, str]] = Field(None, validation_alias=AliasChoices('cursor', 'event_id', 'id'))
+    data: Optional[_ProbeData] = None
+
+    @property
+    def position(self) -> Optional[str]:
+        """Stream position to resume from: the server's cursor, else the event timestamp"""
+        if self.cursor is not None:
+            return str(self.cursor)
+        if self.data and self.data.alert:
+            return self.data.alert.timestamp
+        return None
+
+    @property
+    def amount_usd(self) -> float:
+        if self.data and self.data.transaction:
+            return self.data.transaction.amount_usd
+        return 0
+
+    @property
+    def token(self) -> Optional[str]:
+        if self.data and self.data.transaction:
+            return self.data.transaction.token
+        return None
+
+    @property
+    def transaction_hash(self) -> Optional[str]:
+        if self.data and self.data.transaction:
+            return self.data.transaction.transaction_hash
+        return None
+
+def probe_event(raw: Union[bytes, str]) -> WhaleEventProbe:
+    return WhaleEventProbe.model_validate_json(raw)
+
+def decode_event(raw: Union[bytes, str]) -> WhaleEvent:
+    return WhaleEvent.model_validate_json(raw)
@@ -0,0 +1,114 @@
+import html
+from datetime import datetime
+from typing import Optional
+import discord
+from pydantic import BaseModel
+from .whale_events import WhaleAlert
+
+# Alerts are laid out once into a RenderedAlert; each platform only formats it.
+
+SOLSCAN_TX = "https://solscan.io/tx/{}"
+
+class AlertLine(BaseModel):
+    """A line of text with an optional trailing link"""
+    text: str = ""
+    link_text: Optional[str] = None
+    url: Optional[str] = None
+
+class AlertField(BaseModel):
+    name: str
+    value: AlertLine
+
+class RenderedAlert(BaseModel):
+    """A whale alert independent of the platform it is posted to"""
+    title: str
+    color: int
+    timestamp: datetime
+    lines: list[AlertLine] = []
+    fields: list[AlertField] = []
+    image_url: Optional[str] = None
+
+def render_alert(data: WhaleAlert) -> RenderedAlert:
+    transaction = data.transaction
+    token_stats = data.token_stats
+    return RenderedAlert(
+        title=data.alert.title,
+        color=data.alert.color,
+        timestamp=data.alert.timestamp,
+        lines=[
+            AlertLine(text=f"💰 Buy Size: ${transaction.amount_usd:,.2f}"),
+            AlertLine(text=f"🎯 Buy Price: ${transaction.price_usd:.8f}"),
+            AlertLine(text=f"📊 Amount: {transaction.amount_tokens:,.2f} TETSUO"),
+            AlertLine(text=f"📈 24h Volume: ${token_stats.volume_24h or 0:,.2f}"),
+            AlertLine(text=f"💎 Market Cap: ${token_stats.market_cap or 0:,.2f}"),
+            AlertLine(text=f"💵 Current Price: ${token_stats.price_usd or 0:.8f}"),
+            AlertLine(text="🔍", link_text="View on Solscan", url=SOLSCAN_TX.format(transaction.transaction_hash)),
+        ],
+        image_url=data.alert.image.url if data.alert.image else None
+    )
+
+def render_burst(alerts: list[WhaleAlert], list_limit: int = 15) -> RenderedAlert:
+    """One summary for a burst of buys"""
+    total = sum(alert.transaction.amount_usd for alert in alerts)
+    largest = max(alerts, key=lambda alert: alert.transaction.amount_usd)
+    latest = alerts[-1]
+
+    lines = [
+        AlertLine(
+            text=f"💰 ${alert.transaction.amount_usd:,.2f} —",
+            link_text="tx",
+            url=SOLSCAN_TX.format(alert.transaction.transaction_hash)
+        )
+        for alert in alerts[:list_limit]
+    ]
+    if len(alerts) > list_limit:
+        lines.append(AlertLine(text=f"…and {len(alerts) - list_limit} more"))
+
+    return RenderedAlert(
+        title=f"🐋🐋🐋 WHALE FRENZY: {len(alerts)} BUYS 🐋🐋🐋",
+        color=0xFFD700,
+        timestamp=latest.alert.timestamp,
+        lines=lines,
+        fields=[
+            AlertField(name="📊 Total Volume", value=AlertLine(text=f"${total:,.2f}")),
+            AlertField(
+                name="🏆 Largest Buy",
+                value=AlertLine(
+                    text=f"${largest.transaction.amount_usd:,.2f} —",
+                    link_text="tx",
+                    url=SOLSCAN_TX.format(largest.transaction.transaction_hash)
+                )
+            ),
+            AlertField(name="💵 Current Price", value=AlertLine(text=f"${latest.token_stats.price_usd or 0:.8f}")),
+        ]
+    )
+
+def _markdown_line(line: AlertLine) -> str:
+    link = f"[{line.link_text}]({line.url})" if line.url else ""
+    return " ".join(part for part in (line.text, link) if part)
+
+def _html_line(line: AlertLine) -> str:
+    link = f'<a href="{html.escape(line.url)}">{html.escape(line.link_text or line.url)}</a>' if line.url else ""
+    return " ".join(part for part in (html.escape(line.text), link) if part)
+
+def to_discord_embed(rendered: RenderedAlert) -> discord.Embed:
+    embed = discord.Embed(
+        title=rendered.title,
+        description="\n".join(_markdown_line(line) for line in rendered.lines),
+        color=rendered.color,
+        timestamp=rendered.timestamp
+    )
+    for field in rendered.fields:
+        embed.add_field(name=field.name, value=_markdown_line(field.value), inline=True)
+    if rendered.image_url:
+        embed.set_image(url=rendered.image_url)
+    return embed
+
+def to_telegram_html(rendered: RenderedAlert) -> str:
+    """Telegram message text for parse_mode=HTML; images are left to Discord"""
+    parts = [f"<b>{html.escape(rendered.title)}</b>", ""]
+    parts.extend(_html_line(line) for line in rendered.lines)
+    if rendered.fields:
+        parts.append("")
+        parts.extend(f"<b>{html.escape(field.name)}:</b> {_html_line(field.value)}" for field in rendered.fields)
+    return "\n".join(parts)
@@ -0,0 +1,78 @@
+import time
+import heapq
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+# name: (span in seconds, number of buckets)
+WINDOWS = {
+    '1h': (60 * 60, 60),            # 1 minute buckets
+    '24h': (24 * 60 * 60, 96),      # 15 minute buckets
+    '7d': (7 * 24 * 60 * 60, 168),  # 1 hour buckets
+}
+
+class RollingWindow:
+    """Count, sum, max and top-N over a sliding window, in a fixed ring of buckets
+
+    Each bucket holds aggregates for bucket_seconds of time and is reset lazily
+    when the ring wraps around to it, so memory never grows with traffic. The
+    window is accurate to one bucket."""
+
+    def __init__(self, span_seconds: int, buckets: int, top_n: int = 5):
+        self.bucket_seconds = span_seconds / buckets
+        self.size = buckets
+        self.top_n = top_n
+        self.ids = array('q', [-1]) * buckets
+        self.counts = array('q', [0]) * buckets
+        self.sums = array('d', [0.0]) * buckets
+        self.maxes = array('d', [0.0]) * buckets
+        self.tops: List[List[Tuple[float, str]]] = [[] for _ in range(buckets)]  # min-heaps of (amount, tx)
+
+    def _bucket(self, timestamp: float) -> int:
+        bucket_id = int(timestamp // self.bucket_seconds)
+        index = bucket_id % self.size
+        if self.ids[index] != bucket_id:
+            self.ids[index] = bucket_id
+            self.counts[index] = 0
+            self.sums[index] = 0.0
+            self.maxes[index] = 0.0
+            self.tops[index] = []
+        return index
+
+    def record(self, amount: float, tx_hash: str, timestamp: float):
+        if int(timestamp // self.bucket_seconds) <= int(time.time() // self.bucket_seconds) - self.size:
+            return  # Older than the window
+        index = self._bucket(timestamp)
+        self.counts[index] += 1
+        self.sums[index] += amount
+        self.maxes[index] = max(self.maxes[index], amount)
+        top = self.tops[index]
+        if len(top) < self.top_n:
+            heapq.heappush(top, (amount, tx_hash))
+        elif amount > top[0][0]:
+            heapq.heapreplace(top, (amount, tx_hash))
+
+    def summary(self, now: float = None) -> dict:
+        current = int((now or time.time()) // self.bucket_seconds)
+        live = [index for index in range(self.size) if current - self.size < self.ids[index] <= current]
+        return {
+            'count': sum(self.counts[index] for index in live),
+            'sum': sum(self.sums[index] for index in live),
+            'max': max((self.maxes[index] for index in live), default=0.0),
+            'top': heapq.nlargest(self.top_n, (item for index in live for item in self.tops[index])),
+        }
+
+class WhaleStats:
+    """Rolling whale buy aggregates for every window in WINDOWS"""
+
+    def __init__(self, top_n: int = 5):
+        self.windows: Dict[str, RollingWindow] = {
+            name: RollingWindow(span, buckets, top_n) for name, (span, buckets) in WINDOWS.items()
+        }
+
+    def record(self, amount: float, tx_hash: str, timestamp: Optional[float] = None):
+        timestamp = timestamp or time.time()
+        for window in self.windows.values():
+            window.record(amount, tx_hash, timestamp)
+
+    def summary(self, window: str) -> dict:
+        return self.windows[window].summary()
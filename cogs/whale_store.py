@@ -0,0 +1,77 @@
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+import logging
+from pydantic import BaseModel
+
+logger = logging.getLogger('tetsuo_bot.whale_store')
+
+class WhaleQuery(BaseModel):
+    """Filters for a whale event search; None means unbounded"""
+    min_amount: Optional[float] = None
+    max_amount: Optional[float] = None
+    since: Optional[float] = None
+    until: Optional[float] = None
+    wallet: Optional[str] = None
+    token: Optional[str] = None
+
+    def where(self) -> Tuple[str, list]:
+        clauses, params = [], []
+        for column, operator, value in (
+            ('amount_usd', '>=', self.min_amount),
+            ('amount_usd', '<=', self.max_amount),
+            ('timestamp', '>=', self.since),
+            ('timestamp', '<=', self.until),
+            ('wallet', '=', self.wallet),
+            ('token', '=', self.token),
+        ):
+            if value is not None:
+                clauses.append(f"{column} {operator} ?")
+                params.append(value)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+class WhaleEventStore:
+    """Every whale event received, in SQLite, indexed for range and wallet lookups
+
+    Methods are blocking; call them through asyncio.to_thread from the cogs."""
+
+    COLUMNS = "tx_hash, timestamp, amount_usd, token, wallet"
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(self.path, check_same_thread=False)
+        with self.lock, self.db:
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS events ("
+                "tx_hash TEXT PRIMARY KEY, timestamp REAL NOT NULL, amount_usd REAL NOT NULL, token TEXT, wallet TEXT)"
+            )
+            self.db.execute("CREATE INDEX IF NOT EXISTS events_timestamp ON events (timestamp)")
+            self.db.execute("CREATE INDEX IF NOT EXISTS events_amount ON events (amount_usd)")
+            self.db.execute("CREATE INDEX IF NOT EXISTS events_wallet ON events (wallet, timestamp)")
+
+    def insert_many(self, rows: List[tuple]):
+        """Insert (tx_hash, timestamp, amount_usd, token, wallet) rows in one transaction"""
+        with self.lock, self.db:
+            self.db.executemany(f"INSERT OR IGNORE INTO events ({self.COLUMNS}) VALUES (?, ?, ?, ?, ?)", rows)
+
+    def search(self, query: WhaleQuery, limit: int = 10, offset: int = 0) -> List[tuple]:
+        """Matching events, newest first"""
+        where, params = query.where()
+        with self.lock:
+            return self.db.execute(
+                f"SELECT {self.COLUMNS} FROM events{where} ORDER BY timestamp DESC LIMIT ? OFFSET ?",
+                params + [limit, offset]
+            ).fetchall()
+
+    def count(self, query: WhaleQuery) -> Tuple[int, float]:
+        """(number of matching events, their total USD volume)"""
+        where, params = query.where()
+        with self.lock:
+            count, total = self.db.execute(f"SELECT COUNT(*), SUM(amount_usd) FROM events{where}", params).fetchone()
+        return count, total or 0.0
+
+    def close(self):
+        with self.lock:
+            self.db.close()
@@ -1,23 +1,70 @@
 import discord
 from discord.ext import commands
 import asyncio
+import heapq
+import itertools
 import json
 import os
-from datetime import datetime, timezone
+import random
+import time
+from bisect import bisect_right
+from collections import deque
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import websockets
-from typing import Optional
+from websockets.asyncio.client import connect as ws_connect
+import aiohttp
+from typing import Literal, Optional
 import logging
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError, field_validator
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from .request_budget import get_request_budget
+from .whale_events import WhaleAlert, decode_event, probe_event
+from .whale_dedup import RecentHashes
+from .alert_ledger import AlertLedger
+from .whale_stats import WINDOWS, WhaleStats
+from .whale_store import WhaleEventStore, WhaleQuery
+from .whale_render import render_alert, render_burst, to_discord_embed, to_telegram_html
+from .telegram_utils import TelegramMessenger
+from telegram import error as telegram_error
 
 logger = logging.getLogger('tetsuo_bot.whale_watcher')
 
+class AlertSubscription(BaseModel):
+    """A channel receiving whale alerts above its own threshold"""
+    channel_id: int
+    min_threshold: int = 5000
+    tokens: list[str] = []  # Empty means every token
+    platform: Literal['discord', 'telegram'] = 'discord'
+
+    @field_validator('tokens')
+    @classmethod
+    def normalize_tokens(cls, value: list[str]) -> list[str]:
+        return [token.upper() for token in value]
+
+    def wants_token(self, token: Optional[str]) -> bool:
+        # Events that don't name their token can't be filtered
+        return not self.tokens or token is None or token.upper() in self.tokens
+
 class BotConfig(BaseModel):
     channel_id: Optional[int] = None
     min_threshold: int = 5000
     notifications_enabled: bool = True
+    tokens: list[str] = []  # Token filter sent to the feed; empty means every token
+    subscriptions: list[AlertSubscription] = []  # Extra channels on top of the main one
+
+    @field_validator('tokens')
+    @classmethod
+    def normalize_tokens(cls, value: list[str]) -> list[str]:
+        return [token.upper() for token in value]
+
+    def all_subscriptions(self) -> list[AlertSubscription]:
+        """The main alert channel plus every extra subscription"""
+        primary = []
+        if self.channel_id:
+            primary = [AlertSubscription(channel_id=self.channel_id, min_threshold=self.min_threshold, tokens=self.tokens)]
+        return primary + self.subscriptions
 
     @classmethod
     def load(cls) -> 'BotConfig':
@@ -30,156 +77,834 @@ class BotConfig(BaseModel):
         config_path = Path("discord_whale_config.json")
         config_path.write_text(self.model_dump_json(indent=2))
 
+class SubscriptionIndex:
+    """Subscriptions sorted by threshold, so routing an event is a binary search"""
+
+    def __init__(self, subscriptions: list[AlertSubscription]):
+        self.subscriptions = sorted(subscriptions, key=lambda subscription: subscription.min_threshold)
+        self.thresholds = [subscription.min_threshold for subscription in self.subscriptions]
+
+    @property
+    def min_threshold(self) -> Optional[int]:
+        return self.thresholds[0] if self.thresholds else None
+
+    @property
+    def tokens(self) -> list[str]:
+        """Union of token filters; empty if any subscription wants every token"""
+        if any(not subscription.tokens for subscription in self.subscriptions):
+            return []
+        return sorted({token for subscription in self.subscriptions for token in subscription.tokens})
+
+    def match(self, amount_usd: float, token: Optional[str] = None) -> list[AlertSubscription]:
+        """Every subscription whose threshold the amount meets"""
+        eligible = self.subscriptions[:bisect_right(self.thresholds, amount_usd)]
+        return [subscription for subscription in eligible if subscription.wants_token(token)]
+
 class Settings(BaseSettings):
     """Discord bot whale watcher settings"""
     WS_URL: str = "ws://localhost:8080/ws"
+    WS_URLS: str = ""  # Comma separated; overrides WS_URL to watch several feeds at once
+    WHALE_REORDER_SECONDS: float = 2.0  # How long merged events wait for earlier ones from slower feeds
+    WHALE_QUEUE_SIZE: int = 500
+    # What to do when alerts arrive faster than Discord accepts them
+    WHALE_OVERFLOW_POLICY: Literal['drop_oldest', 'drop_newest', 'block'] = 'drop_oldest'
+    WHALE_SENDER_WORKERS: int = 1  # More than one worker may post alerts out of order
+    WHALE_RAW_LOG_EVERY: int = 100  # Log one raw payload in N at DEBUG
+    # More than WHALE_BURST_THRESHOLD alerts within WHALE_BURST_WINDOW seconds are merged into one summary
+    WHALE_BURST_WINDOW: float = 8.0
+    WHALE_BURST_THRESHOLD: int = 3
+    WHALE_DEDUP_FILE: str = "whale_dedup.json"
+    WHALE_DEDUP_SIZE: int = 10000
+    WHALE_DEDUP_TTL_HOURS: float = 24
+    # Reconnects back off exponentially with full jitter, so clients don't reconnect in lockstep
+    WHALE_RECONNECT_BASE: float = 1.0
+    WHALE_RECONNECT_MAX: float = 120.0
+    WHALE_STABLE_SECONDS: float = 60.0  # A connection that lasted this long resets the backoff
+    WHALE_LEDGER_FILE: str = "whale_alerts.db"
+    WHALE_ALERT_RETENTION_HOURS: float = 72
+    WHALE_STORE_FILE: str = "whale_events.db"
+    WHALE_STORE_FLUSH_SECONDS: float = 2.0
+    # 'webhook' posts through a managed webhook per channel, on its own rate-limit bucket
+    WHALE_DELIVERY_MODE: Literal['channel', 'webhook'] = 'channel'
+    # Mirror alerts that reach the main channel threshold to these Telegram chats (comma separated); empty disables
+    WHALE_TELEGRAM_CHAT_ID: str = ""
+    TELEGRAM_BOT_TOKEN: str = ""
+    WHALE_TELEGRAM_QUEUE_SIZE: int = 100
+    WHALE_TELEGRAM_RETRIES: int = 3
     
     class Config:
         env_file = ".env"
         env_file_encoding = 'utf-8'
         extra = 'allow'
 
+    @property
+    def feed_urls(self) -> list[str]:
+        urls = [url.strip() for url in self.WS_URLS.split(',') if url.strip()]
+        return urls or [self.WS_URL]
+
 @lru_cache()
 def get_settings() -> Settings:
     """Get cached settings instance"""
     return Settings()
 
+class LatencyStats:
+    """Recent latency samples in seconds, for status commands"""
+
+    def __init__(self, size: int = 500):
+        self.samples = deque(maxlen=size)
+        self.count = 0
+
+    def record(self, seconds: float):
+        self.samples.append(seconds)
+        self.count += 1
+
+    def summary(self) -> dict:
+        if not self.samples:
+            return {'count': self.count, 'avg': 0.0, 'p95': 0.0, 'max': 0.0}
+        ordered = sorted(self.samples)
+        return {
+            'count': self.count,
+            'avg': sum(ordered) / len(ordered),
+            'p95': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+            'max': ordered[-1],
+        }
+
+class FeedState:
+    """Connection state for one whale WebSocket feed"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.ws = None
+        self.cursor = None  # Position of the last event seen, sent as a replay request on reconnect
+        self.connected_at = None
+        self.stats = {'connects': 0, 'reconnects': 0, 'uptime': 0.0, 'replays': 0, 'subscriptions': 0, 'last_error': None}
+
+    def uptime(self) -> float:
+        uptime = self.stats['uptime']
+        if self.connected_at is not None:
+            uptime += time.monotonic() - self.connected_at
+        return uptime
+
+class WhaleSearchView(discord.ui.View):
+    """Previous/next buttons over a whale event search, one query per page"""
+
+    def __init__(self, monitor, author_id: int, query: WhaleQuery, total: int, volume: float, page_size: int = 10):
+        super().__init__(timeout=180)
+        self.monitor = monitor
+        self.author_id = author_id
+        self.query = query
+        self.total = total
+        self.volume = volume
+        self.page_size = page_size
+        self.page = 0
+        self.pages = max(1, -(-total // page_size))
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return interaction.user.id == self.author_id
+
+    async def render(self) -> discord.Embed:
+        rows = await asyncio.to_thread(
+            self.monitor.event_store.search, self.query, self.page_size, self.page * self.page_size
+        )
+        lines = [
+            f"<t:{int(timestamp)}:R> **${amount:,.2f}**"
+            + (f" {token}" if token else "")
+            + (f" by `{wallet[:4]}…{wallet[-4:]}`" if wallet else "")
+            + f" — [tx](https://solscan.io/tx/{tx_hash})"
+            for tx_hash, timestamp, amount, token, wallet in rows
+        ]
+        embed = discord.Embed(
+            title="🔎 Whale Search",
+            description="\n".join(lines) or "No matching buys.",
+            color=0x1DA1F2
+        )
+        embed.set_footer(text=f"Page {self.page + 1}/{self.pages} • {self.total:,} buys • ${self.volume:,.2f} total")
+        self.previous_page.disabled = self.page == 0
+        self.next_page.disabled = self.page >= self.pages - 1
+        return embed
+
+    @discord.ui.button(label="◀ Previous", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = max(0, self.page - 1)
+        await interaction.response.edit_message(embed=await self.render(), view=self)
+
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = min(self.pages - 1, self.page + 1)
+        await interaction.response.edit_message(embed=await self.render(), view=self)
+
 class WhaleMonitor(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.config = BotConfig.load()
         self.settings = get_settings()
+        # Telegram mirror with its own queue, so a slow Telegram API never holds up Discord
+        self.telegram = None
+        if self.settings.WHALE_TELEGRAM_CHAT_ID and self.settings.TELEGRAM_BOT_TOKEN:
+            self.telegram = TelegramMessenger(self.settings.TELEGRAM_BOT_TOKEN, self.settings.WHALE_TELEGRAM_CHAT_ID)
+        # One queue and worker per chat, so a chat stuck in retries never delays the others
+        self.telegram_queues = {
+            chat_id: asyncio.Queue(maxsize=self.settings.WHALE_TELEGRAM_QUEUE_SIZE)
+            for chat_id in (self.telegram.chats if self.telegram else {})
+        }
+        self.telegram_tasks = []
+        self.telegram_stats = {'queued': 0, 'sent': 0, 'retries': 0, 'failed': 0, 'dropped': 0}
+        self.rebuild_routes()
         self._ws_task = None
         self.cleanup_task = None
+        self.budget = get_request_budget()
+        self.ledger = AlertLedger(self.settings.WHALE_LEDGER_FILE)  # Sent alerts, so cleanup never scans history
+        self.ledger_backfilled = False
+        # Receiver -> sender hand-off so slow Discord sends never stall ws.recv()
+        self.alert_queue = asyncio.Queue(maxsize=self.settings.WHALE_QUEUE_SIZE)
+        self.sender_tasks = []
+        self.queue_stats = {'enqueued': 0, 'dropped': 0, 'sent': 0, 'max_depth': 0, 'bursts': 0, 'aggregated': 0}
+        self.alert_lag = LatencyStats()
+        self.decode_stats = {'received': 0, 'skipped': 0, 'decoded': 0, 'invalid': 0}
+        self.recent_alerts = deque()  # Arrival times of qualifying alerts inside the burst window
+        self.burst_batch = []
+        self.burst_flush_task = None
+        self.burst_list_limit = 15
+        # Transaction hashes already alerted, so feed replays after reconnects are dropped
+        self.dedup = RecentHashes(
+            self.settings.WHALE_DEDUP_FILE,
+            max_size=self.settings.WHALE_DEDUP_SIZE,
+            ttl=self.settings.WHALE_DEDUP_TTL_HOURS * 60 * 60
+        )
+        self.dedup.load()
+        self.dedup_task = None
+        self.whale_stats = WhaleStats()
+        # Every received whale event is buffered here and written to SQLite in batches
+        self.event_store = WhaleEventStore(self.settings.WHALE_STORE_FILE)
+        self.store_buffer = deque(maxlen=10000)
+        self.store_stats = {'stored': 0, 'dropped': 0}
+        self.store_task = None
+        self.webhooks = {}  # channel_id -> Webhook, or None where webhooks are unavailable
+        self.webhook_retry_at = {}  # channel_id -> when to try setting up a webhook again after an error
+        self.webhook_name = "Whale Alerts"
+        self.webhook_lock = asyncio.Lock()
+        self.webhook_session = None
+        self.delivery_latency = {'channel': LatencyStats(), 'webhook': LatencyStats(), 'telegram': LatencyStats()}
+        self.feeds = {url: FeedState(url) for url in self.settings.feed_urls}
+        # Events from several feeds merge through a heap ordered by event time
+        self.merge_heap = []
+        self.merge_sequence = itertools.count()
+        self.merge_wakeup = asyncio.Event()
 
     async def cleanup_messages(self):
-        """Delete whale alert messages older than 3 days"""
+        """Delete whale alerts once they pass the retention period, straight from the ledger"""
         while True:
             try:
-                if not self.config.channel_id:
-                    await asyncio.sleep(30)
-                    continue
-                    
-                channel = self.bot.get_channel(self.config.channel_id)
-                if not channel or not isinstance(channel, discord.TextChannel):
-                    await asyncio.sleep(30)
-                    continue
+                if self.ledger.created and not self.ledger_backfilled:
+                    # First run with a fresh ledger: pick up alerts posted before it existed
+                    await self.backfill_ledger()
 
-                cutoff = datetime.now(timezone.utc).timestamp() - (3 * 24 * 60 * 60)  # 3 days in seconds
-                deleted = 0
-                
-                async for message in channel.history(limit=None):
-                    if (not message.pinned and 
-                        message.created_at.timestamp() < cutoff and 
-                        message.author == self.bot.user):
-                        try:
-                            await message.delete()
-                            deleted += 1
-                            await asyncio.sleep(1)  # Rate limiting protection
-                        except Exception as e:
-                            logger.error(f"Error deleting message: {e}")
+                retention = self.settings.WHALE_ALERT_RETENTION_HOURS * 60 * 60
+                oldest = await asyncio.to_thread(self.ledger.oldest)
+                if oldest is None or oldest > time.time() - retention:
+                    # Nothing has expired: sleep until the oldest alert does (re-checked every 5 minutes)
+                    wait = 300 if oldest is None else oldest + retention - time.time()
+                    await asyncio.sleep(min(300, max(1, wait)))
+                    continue
 
-                if deleted:
-                    logger.info(f"Cleaned up {deleted} old whale alerts")
-                
-                await asyncio.sleep(300)  # Check every 5 minutes
+                expired = await asyncio.to_thread(self.ledger.expired, time.time() - retention)
+                deleted, dropped = await self.delete_alerts(expired)
+                if deleted or dropped:
+                    logger.info(f"Cleaned up {deleted} old whale alerts, dropped {dropped} undeletable ledger rows")
+                else:
+                    # No row could be cleared (e.g. Discord errors): retry on the next check, not in a tight loop
+                    await asyncio.sleep(300)
                     
             except Exception as e:
                 logger.error(f"Whale cleanup error: {e}")
                 await asyncio.sleep(30)
 
-    async def handle_whale_alert(self, data: dict):
-        """Process and send whale alert to Discord"""
-        logger.info(f"Handling whale alert. Config: {self.config}")
-        
+    async def delete_alerts(self, expired) -> tuple[int, int]:
+        """Delete ledger entries' messages, bulk where Discord allows it (under 14 days old)
+
+        Returns (deleted, dropped): rows removed after deleting their message, and
+        rows removed without it because the channel is gone or we may not delete."""
+        bulk_cutoff = time.time() - 14 * 24 * 60 * 60 + 300  # Margin for clock skew
+        by_channel = {}
+        for channel_id, message_id, sent_at in expired:
+            by_channel.setdefault(channel_id, []).append((message_id, sent_at))
+
+        deleted = dropped = 0
+        for channel_id, messages in by_channel.items():
+            channel = self.bot.get_channel(channel_id)
+            message_ids = [message_id for message_id, _ in messages]
+            if not channel:
+                # Channel is gone; nothing left to delete
+                await asyncio.to_thread(self.ledger.remove, message_ids)
+                dropped += len(message_ids)
+                continue
+
+            bulk = [message_id for message_id, sent_at in messages if sent_at > bulk_cutoff]
+            single = [message_id for message_id, sent_at in messages if sent_at <= bulk_cutoff]
+            done = []
+            given_up = []  # Messages we may not delete; dropped from the ledger so they aren't retried forever
+
+            for i in range(0, len(bulk), 100):
+                batch = bulk[i:i + 100]
+                # Background work: paced by the request budget instead of a fixed sleep
+                await self.budget.acquire('discord', background=True)
+                try:
+                    if len(batch) == 1:
+                        await channel.get_partial_message(batch[0]).delete()
+                    else:
+                        await channel.delete_messages([discord.Object(id=message_id) for message_id in batch])
+                    done.extend(batch)
+                except discord.HTTPException as e:
+                    logger.debug(f"Bulk delete failed, falling back to single deletes: {e}")
+                    single.extend(batch)
+
+            for message_id in single:
+                await self.budget.acquire('discord', background=True)
+                try:
+                    await channel.get_partial_message(message_id).delete()
+                except discord.NotFound:
+                    pass  # Already gone, drop it from the ledger too
+                except discord.Forbidden as e:
+                    logger.warning(f"Not allowed to delete whale alert {message_id} in #{channel.name}, forgetting it: {e}")
+                    given_up.append(message_id)
+                    continue
+                except Exception as e:
+                    logger.error(f"Error deleting message: {e}")
+                    continue
+                done.append(message_id)
+
+            await asyncio.to_thread(self.ledger.remove, done + given_up)
+            deleted += len(done)
+            dropped += len(given_up)
+        return deleted, dropped
+
+    async def backfill_ledger(self):
+        """One-time history scan recording alerts posted before the ledger existed"""
         if not self.config.channel_id:
-            logger.warning("No channel ID configured")
             return
-            
-        if not self.config.notifications_enabled:
-            logger.info("Notifications are disabled")
-            return
-            
         channel = self.bot.get_channel(self.config.channel_id)
-        if not channel:
-            logger.error(f"Could not find channel with ID: {self.config.channel_id}")
+        if not channel or not isinstance(channel, discord.TextChannel):
             return
 
-        transaction = data['transaction']
-        if transaction['amount_usd'] < self.config.min_threshold:
-            logger.info(f"Transaction below threshold: ${transaction['amount_usd']} < ${self.config.min_threshold}")
+        rows = [
+            (channel.id, message.id, message.created_at.timestamp())
+            async for message in channel.history(limit=None)
+            if message.author == self.bot.user and not message.pinned
+        ]
+        await asyncio.to_thread(self.ledger.record_many, rows)
+        self.ledger_backfilled = True
+        logger.info(f"Whale alert ledger backfilled with {len(rows)} existing alerts")
+
+    def decode_message(self, raw, feed: FeedState = None) -> Optional[WhaleAlert]:
+        """Decode a raw frame, rejecting non-whale and sub-threshold events from a slim probe"""
+        self.decode_stats['received'] += 1
+        if logger.isEnabledFor(logging.DEBUG) and self.decode_stats['received'] % self.settings.WHALE_RAW_LOG_EVERY == 1:
+            logger.debug(f"Raw WebSocket message (1 in {self.settings.WHALE_RAW_LOG_EVERY}): {raw[:500]!r}")
+
+        probe = probe_event(raw)
+        if probe.position and feed:
+            feed.cursor = probe.position
+        if probe.event_type != 'new_whale':
+            logger.debug(f"Received non-whale event: {probe.event_type}")
+            self.decode_stats['skipped'] += 1
+            return None
+
+        # Stored whether or not it is alerted
+        self.buffer_event(probe)
+
+        # Local safety net behind the server-side subscription filter
+        if not self.routes.match(probe.amount_usd, probe.token):
+            # Rejected before building the full event
+            self.decode_stats['skipped'] += 1
+            return None
+
+        # Also drops the same event arriving from a second feed. Only checked here:
+        # the hash is remembered by accept_alert once the event is decoded and taken
+        if probe.transaction_hash and self.dedup.seen(probe.transaction_hash):
+            logger.debug(f"Duplicate whale event dropped: {probe.transaction_hash}")
+            return None
+
+        # Second, full parse of the frame. Accepted: only events that passed the
+        # filters above get here, a small share of the feed; everything else is
+        # parsed once by the slim probe.
+        event = decode_event(raw)
+        self.decode_stats['decoded'] += 1
+        if event.data:
+            transaction = event.data.transaction
+            # Event time, so replayed events land in the right bucket
+            self.whale_stats.record(
+                transaction.amount_usd,
+                transaction.transaction_hash,
+                min(event.data.alert.timestamp.timestamp(), time.time())
+            )
+        return event.data
+
+    def buffer_event(self, probe):
+        """Queue an event row for the store; persist_events writes them in batches"""
+        transaction = probe.data.transaction if probe.data else None
+        if not transaction or not transaction.transaction_hash:
             return
 
-        alert_data = data['alert']
-        token_stats = data['token_stats']
-        
-        # Create embed from alert data
-        embed = discord.Embed(
-            title=alert_data['title'],
-            description=(
-                f"💰 Buy Size: ${transaction['amount_usd']:,.2f}\n"
-                f"🎯 Buy Price: ${transaction['price_usd']:.8f}\n"
-                f"📊 Amount: {transaction['amount_tokens']:,.2f} TETSUO\n"
-                f"📈 24h Volume: ${float(token_stats['volume_24h'] or 0):,.2f}\n"
-                f"💎 Market Cap: ${float(token_stats['market_cap'] or 0):,.2f}\n"
-                f"💵 Current Price: ${float(token_stats['price_usd'] or 0):.8f}\n"
-                f"🔍 [View on Solscan](https://solscan.io/tx/{transaction['transaction_hash']})"
-            ),
-            color=alert_data['color'],
-            timestamp=datetime.fromisoformat(alert_data['timestamp'])
+        timestamp = (probe.data.alert.epoch if probe.data.alert else None) or time.time()
+
+        if len(self.store_buffer) == self.store_buffer.maxlen:
+            self.store_stats['dropped'] += 1
+        self.store_buffer.append((
+            transaction.transaction_hash,
+            timestamp,
+            transaction.amount_usd,
+            transaction.token.upper() if transaction.token else None,
+            transaction.wallet
+        ))
+
+    async def persist_events(self):
+        """Flush buffered events to the store off the event loop"""
+        while True:
+            await asyncio.sleep(self.settings.WHALE_STORE_FLUSH_SECONDS)
+            if not self.store_buffer:
+                continue
+            rows = list(self.store_buffer)
+            self.store_buffer.clear()
+            try:
+                await asyncio.to_thread(self.event_store.insert_many, rows)
+                self.store_stats['stored'] += len(rows)
+            except Exception as e:
+                logger.error(f"Error writing whale events: {e}", exc_info=True)
+
+    async def persist_dedup(self):
+        """Flush the dedup index periodically rather than on every alert"""
+        while True:
+            await asyncio.sleep(60)
+            self.dedup.save()
+
+    async def enqueue_alert(self, alert: WhaleAlert):
+        """Hand an event to the sender workers, applying the overflow policy when full"""
+        item = (time.monotonic(), alert)
+        policy = self.settings.WHALE_OVERFLOW_POLICY
+
+        if self.alert_queue.full():
+            if policy == 'drop_newest':
+                self.dedup.discard(alert.transaction.transaction_hash)
+                self.queue_stats['dropped'] += 1
+                logger.warning("Whale alert queue full, dropping newest alert")
+                return
+            if policy == 'drop_oldest':
+                _, dropped = self.alert_queue.get_nowait()
+                self.alert_queue.task_done()
+                self.dedup.discard(dropped.transaction.transaction_hash)
+                self.queue_stats['dropped'] += 1
+                logger.warning("Whale alert queue full, dropping oldest alert")
+
+        # 'block' applies backpressure to the socket instead of dropping
+        await self.alert_queue.put(item)
+        self.queue_stats['enqueued'] += 1
+        self.queue_stats['max_depth'] = max(self.queue_stats['max_depth'], self.alert_queue.qsize())
+
+    async def send_alerts(self):
+        """Sender worker: drain the queue and post alerts, batching them during bursts"""
+        while True:
+            received_at, alert = await self.alert_queue.get()
+            try:
+                if not self.routes.match(alert.transaction.amount_usd, alert.transaction.token):
+                    continue  # Thresholds raised while the alert was queued
+                if self.register_arrival():
+                    self.buffer_burst(received_at, alert)
+                elif await self.handle_whale_alert(alert):
+                    self.record_sent([received_at])
+            except Exception as e:
+                logger.error(f"Error in whale alert sender: {e}", exc_info=True)
+            finally:
+                self.alert_queue.task_done()
+
+    def record_sent(self, received_times):
+        self.queue_stats['sent'] += len(received_times)
+        now = time.monotonic()
+        for received_at in received_times:
+            self.alert_lag.record(now - received_at)
+
+    def register_arrival(self) -> bool:
+        """Track qualifying alerts in the sliding window; True once it holds more than the burst threshold"""
+        now = time.monotonic()
+        while self.recent_alerts and self.recent_alerts[0] <= now - self.settings.WHALE_BURST_WINDOW:
+            self.recent_alerts.popleft()
+        self.recent_alerts.append(now)
+        # Once a batch is open everything joins it, so alerts stay in order
+        return bool(self.burst_batch) or len(self.recent_alerts) > self.settings.WHALE_BURST_THRESHOLD
+
+    def buffer_burst(self, received_at: float, alert: WhaleAlert):
+        self.burst_batch.append((received_at, alert))
+        if not self.burst_flush_task:
+            self.burst_flush_task = asyncio.create_task(self.flush_burst())
+
+    async def flush_burst(self):
+        """Post everything buffered during the window as a single summary"""
+        try:
+            await asyncio.sleep(self.settings.WHALE_BURST_WINDOW)
+        finally:
+            batch, self.burst_batch = self.burst_batch, []
+            self.burst_flush_task = None
+
+        alerts = [alert for _, alert in batch]
+        if len(alerts) == 1:
+            sent = await self.handle_whale_alert(alerts[0])
+        else:
+            sent = await self.handle_burst(alerts)
+            self.queue_stats['bursts'] += 1
+            self.queue_stats['aggregated'] += len(alerts)
+        if sent:
+            self.record_sent([received_at for received_at, _ in batch])
+
+    def rebuild_routes(self):
+        """Re-index subscriptions after a config change"""
+        subscriptions = self.config.all_subscriptions()
+        if self.telegram:
+            # Follows the main channel's threshold and token filter
+            subscriptions.append(AlertSubscription(
+                channel_id=0, min_threshold=self.config.min_threshold, tokens=self.config.tokens, platform='telegram'
+            ))
+        self.routes = SubscriptionIndex(subscriptions)
+
+    def get_alert_channel(self, subscription: AlertSubscription):
+        """The subscription's channel, or None if alerts can't be posted right now"""
+        if not self.config.notifications_enabled:
+            logger.info("Notifications are disabled")
+            return None
+            
+        channel = self.bot.get_channel(subscription.channel_id)
+        if not channel:
+            logger.error(f"Could not find channel with ID: {subscription.channel_id}")
+        return channel
+
+    async def deliver(self, deliveries) -> bool:
+        """Send (channel, embed, description) tuples concurrently; True if any landed"""
+        if not deliveries:
+            if not self.routes.subscriptions:
+                logger.warning("No channel ID configured")
+            return False
+        results = await asyncio.gather(
+            *(self.post_alert(channel, embed, description) for channel, embed, description in deliveries),
+            return_exceptions=True
         )
+        return any(result is True for result in results)
+
+    async def get_webhook(self, channel):
+        """The channel's managed webhook, created once and cached; None if we can't manage webhooks"""
+        if self.webhook_retry_at.get(channel.id, float('inf')) <= time.monotonic():
+            self.webhooks.pop(channel.id, None)
+            self.webhook_retry_at.pop(channel.id, None)
+        if channel.id in self.webhooks:
+            return self.webhooks[channel.id]
+
+        async with self.webhook_lock:
+            if channel.id in self.webhooks:
+                return self.webhooks[channel.id]
+
+            webhook = None
+            try:
+                await self.budget.acquire('discord')
+                existing = [
+                    hook for hook in await channel.webhooks()
+                    if hook.user == self.bot.user and hook.name == self.webhook_name and hook.token
+                ]
+                hook = existing[0] if existing else await channel.create_webhook(name=self.webhook_name)
+                if self.webhook_session is None:
+                    self.webhook_session = aiohttp.ClientSession()
+                # Bound to our pooled session rather than the bot's HTTP client
+                webhook = discord.Webhook.partial(hook.id, hook.token, session=self.webhook_session)
+            except discord.Forbidden:
+                logger.warning(f"Missing Manage Webhooks in #{channel.name}, using channel.send")
+            except discord.HTTPException as e:
+                # e.g. too many webhooks in the channel (30007) or a 5xx; don't retry on every alert
+                logger.warning(f"Could not set up alert webhook in #{channel.name}, using channel.send: {e}")
+                self.webhook_retry_at[channel.id] = time.monotonic() + 600
 
-        if 'image' in alert_data and 'url' in alert_data['image']:
-            embed.set_image(url=alert_data['image']['url'])
+            self.webhooks[channel.id] = webhook
+            return webhook
 
+    async def send_embed(self, channel, embed):
+        """Send via the configured delivery mode; returns (message, mode used)"""
+        if self.settings.WHALE_DELIVERY_MODE == 'webhook':
+            webhook = await self.get_webhook(channel)
+            if webhook:
+                try:
+                    message = await webhook.send(
+                        embed=embed,
+                        username=self.bot.user.name,
+                        avatar_url=self.bot.user.display_avatar.url,
+                        wait=True
+                    )
+                    return message, 'webhook'
+                except discord.NotFound:
+                    # Webhook was deleted: recreate it next time, use the bot for this alert
+                    logger.warning(f"Alert webhook for #{channel.name} is gone, falling back to channel.send")
+                    self.webhooks.pop(channel.id, None)
+                except discord.HTTPException as e:
+                    logger.warning(f"Alert webhook send failed in #{channel.name}, falling back to channel.send: {e}")
+
+        await self.budget.acquire('discord')
+        return await channel.send(embed=embed), 'channel'
+
+    async def post_alert(self, channel, embed, description: str) -> bool:
         try:
-            await channel.send(embed=embed)
-            logger.info(f"Successfully sent alert for tx: {transaction['transaction_hash']}")
+            started = time.monotonic()
+            message, mode = await self.send_embed(channel, embed)
+            self.delivery_latency[mode].record(time.monotonic() - started)
+            await asyncio.to_thread(self.ledger.record, channel.id, message.id, message.created_at.timestamp())
+            logger.info(f"Successfully sent {description}")
+            return True
         except Exception as e:
             logger.error(f"Error sending alert: {e}", exc_info=True)
             try:
-                channel = await self.bot.fetch_channel(self.config.channel_id)
+                channel = await self.bot.fetch_channel(channel.id)
                 logger.info(f"Channel details: {channel}")
             except Exception as channel_error:
                 logger.error(f"Could not retrieve channel details: {channel_error}")
+            return False
+
+    def mirror_to_telegram(self, rendered) -> bool:
+        """Queue an alert for every chat's worker without waiting on it; the oldest is dropped when full"""
+        text = to_telegram_html(rendered)
+        for chat_id, queue in self.telegram_queues.items():
+            if queue.full():
+                queue.get_nowait()
+                queue.task_done()
+                self.telegram_stats['dropped'] += 1
+                logger.warning(f"Telegram alert queue for {chat_id} full, dropping oldest alert")
+            queue.put_nowait(text)
+        self.telegram_stats['queued'] += 1
+        return True
+
+    async def send_telegram_alerts(self, chat):
+        """Telegram worker for one chat: post queued alerts, retrying independently of Discord and other chats"""
+        queue = self.telegram_queues[chat.chat_id]
+        while True:
+            text = await queue.get()
+            try:
+                await self.post_telegram(text, chat)
+            except Exception as e:
+                logger.error(f"Error in Telegram alert sender for {chat.chat_id}: {e}", exc_info=True)
+            finally:
+                queue.task_done()
+
+    async def post_telegram(self, text: str, chat) -> bool:
+        for attempt in range(self.settings.WHALE_TELEGRAM_RETRIES + 1):
+            try:
+                started = time.monotonic()
+                await self.telegram.send_message(text, chat)
+                self.delivery_latency['telegram'].record(time.monotonic() - started)
+                self.telegram_stats['sent'] += 1
+                return True
+            except telegram_error.RetryAfter as e:
+                retry_after = e.retry_after
+                delay = retry_after.total_seconds() if hasattr(retry_after, 'total_seconds') else float(retry_after)
+            except (telegram_error.BadRequest, telegram_error.Forbidden) as e:
+                # Permanent rejections; BadRequest subclasses NetworkError, so it must be caught first
+                logger.error(f"Telegram chat {chat.chat_id} rejected whale alert: {e}")
+                break
+            except telegram_error.NetworkError as e:
+                # Includes timeouts; back off like the feed reconnects
+                delay = self.reconnect_delay(attempt)
+                logger.warning(f"Telegram alert failed ({e}), retrying in {delay:.1f}s")
+            except telegram_error.TelegramError as e:
+                logger.error(f"Telegram chat {chat.chat_id} rejected whale alert: {e}")
+                break
+            if attempt < self.settings.WHALE_TELEGRAM_RETRIES:
+                self.telegram_stats['retries'] += 1
+                await asyncio.sleep(delay)
+        self.telegram_stats['failed'] += 1
+        return False
+
+    async def fan_out(self, subscriptions: list[AlertSubscription], rendered, description: str) -> bool:
+        """Post one rendered alert to the Discord channels and queue it for Telegram"""
+        queued = False
+        if self.telegram and self.config.notifications_enabled and any(
+            subscription.platform == 'telegram' for subscription in subscriptions
+        ):
+            queued = self.mirror_to_telegram(rendered)
+
+        embed = to_discord_embed(rendered)
+        sent = await self.deliver([
+            (channel, embed, description)
+            for subscription in subscriptions
+            if subscription.platform == 'discord' and (channel := self.get_alert_channel(subscription))
+        ])
+        return sent or queued
+
+    async def handle_whale_alert(self, data: WhaleAlert) -> bool:
+        """Send a whale alert to every matching channel, returning True once it is posted"""
+        logger.debug(f"Handling whale alert. Config: {self.config}")
+        transaction = data.transaction
+        subscriptions = self.routes.match(transaction.amount_usd, transaction.token)
+        if not subscriptions:
+            logger.debug(f"Transaction below every threshold: ${transaction.amount_usd}")
+            return False
+
+        return await self.fan_out(subscriptions, render_alert(data), f"alert for tx: {transaction.transaction_hash}")
+
+    async def handle_burst(self, alerts: list) -> bool:
+        """Send a burst as one summary per channel, covering only the alerts that channel wants"""
+        per_channel = {}
+        for alert in alerts:
+            for subscription in self.routes.match(alert.transaction.amount_usd, alert.transaction.token):
+                key = (subscription.platform, subscription.channel_id)
+                per_channel.setdefault(key, (subscription, []))[1].append(alert)
+
+        # Channels wanting the same alerts share one rendering
+        by_alerts = {}
+        for subscription, matched in per_channel.values():
+            by_alerts.setdefault(tuple(map(id, matched)), (matched, []))[1].append(subscription)
+
+        results = await asyncio.gather(*(
+            self.fan_out(subscriptions, render_alert(matched[0]), "alert from burst")
+            if len(matched) == 1 else
+            self.fan_out(
+                subscriptions,
+                render_burst(matched, self.burst_list_limit),
+                f"burst summary of {len(matched)} alerts"
+            )
+            for matched, subscriptions in by_alerts.values()
+        ))
+        return any(results)
+
+    def reconnect_delay(self, attempt: int) -> float:
+        """Exponential backoff with full jitter"""
+        ceiling = min(self.settings.WHALE_RECONNECT_MAX, self.settings.WHALE_RECONNECT_BASE * 2 ** attempt)
+        return random.uniform(0, ceiling)
+
+    def subscription_message(self) -> dict:
+        """The loosest filter covering every subscription"""
+        return {
+            'action': 'subscribe',
+            'event_types': ['new_whale'],
+            'min_amount_usd': self.routes.min_threshold or self.config.min_threshold,
+            'tokens': self.routes.tokens,
+        }
+
+    async def send_subscription(self, feed: FeedState):
+        """Tell the feed which events we want, so sub-threshold traffic never crosses the wire"""
+        if feed.ws is None:
+            return False
+        message = self.subscription_message()
+        await feed.ws.send(json.dumps(message))
+        feed.stats['subscriptions'] += 1
+        logger.info(
+            f"Subscribed to whale feed {feed.url}: "
+            f"${message['min_amount_usd']:,}+ {', '.join(message['tokens']) or 'all tokens'}"
+        )
+        return True
+
+    async def update_subscription(self):
+        """Push changed thresholds to every connected feed; the next connect sends them anyway"""
+        results = await asyncio.gather(
+            *(self.send_subscription(feed) for feed in self.feeds.values()),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Could not update whale feed subscription: {result}")
+
+    async def request_replay(self, feed: FeedState):
+        """Ask the feed to replay anything after our last event; servers without replay ignore it"""
+        if not feed.cursor:
+            return
+        await feed.ws.send(json.dumps({'action': 'resume', 'cursor': feed.cursor}))
+        feed.stats['replays'] += 1
+        logger.info(f"Requested replay from {feed.url} after {feed.cursor}")
 
     async def start_monitoring(self):
-        """Monitor whale alerts via WebSocket"""
+        """Watch every configured feed concurrently and merge them into one stream"""
+        tasks = [self.monitor_feed(feed) for feed in self.feeds.values()]
+        if len(self.feeds) > 1:
+            tasks.append(self.release_merged())
+        await asyncio.gather(*tasks)
+
+    async def accept_alert(self, alert: WhaleAlert):
+        """Single feed: straight to the queue. Several: hold briefly so they merge in event order"""
+        # Before any await, so a copy from another feed is already seen as a duplicate
+        if alert.transaction.transaction_hash:
+            self.dedup.add(alert.transaction.transaction_hash)
+        if len(self.feeds) == 1:
+            await self.enqueue_alert(alert)
+            return
+        heapq.heappush(self.merge_heap, (alert.alert.timestamp.timestamp(), next(self.merge_sequence), time.monotonic(), alert))
+        self.merge_wakeup.set()
+
+    async def release_merged(self):
+        """Emit merged events in timestamp order once each has waited out the reorder window"""
+        window = self.settings.WHALE_REORDER_SECONDS
+        while True:
+            self.merge_wakeup.clear()
+            timeout = None
+            while self.merge_heap:
+                _, _, arrived_at, alert = self.merge_heap[0]
+                remaining = arrived_at + window - time.monotonic()
+                if remaining > 0:
+                    timeout = remaining
+                    break
+                heapq.heappop(self.merge_heap)
+                await self.enqueue_alert(alert)
+            try:
+                await asyncio.wait_for(self.merge_wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def monitor_feed(self, feed: FeedState):
+        """Monitor one WebSocket feed, resuming from its last seen event after reconnects"""
+        attempt = 0
         while True:
             try:
-                async with websockets.connect(self.settings.WS_URL) as ws:
-                    logger.info("WebSocket connected")
+                # The asyncio client explicitly: its recv() takes decode=, the legacy one's doesn't
+                async with ws_connect(feed.url) as ws:
+                    logger.info(f"WebSocket connected: {feed.url}")
+                    feed.connected_at = time.monotonic()
+                    feed.stats['connects'] += 1
+                    feed.ws = ws
+                    # Subscribe before resuming so the replay is filtered too
+                    await self.send_subscription(feed)
+                    await self.request_replay(feed)
                     
                     while True:
                         try:
-                            message = await ws.recv()
-                            logger.info(f"Raw WebSocket message: {message}")
-                            
-                            data = json.loads(message)
-                            logger.info(f"Parsed WebSocket data: {data}")
-                            
-                            if data.get('event_type') == 'new_whale':
-                                logger.info("New whale event received!")
-                                await self.handle_whale_alert(data['data'])
-                            else:
-                                logger.info(f"Received non-whale event: {data.get('event_type')}")
+                            # Raw frame, validated without a separate str decode / json.loads pass
+                            message = await ws.recv(decode=False)
+                            alert = self.decode_message(message, feed)
+                            if alert:
+                                logger.info(f"New whale event received: ${alert.transaction.amount_usd:,.2f}")
+                                await self.accept_alert(alert)
                                 
                         except websockets.ConnectionClosed:
-                            logger.warning("WebSocket connection closed")
+                            logger.warning(f"WebSocket connection closed: {feed.url}")
                             break
-                        except json.JSONDecodeError as je:
-                            logger.error(f"JSON decode error: {je}")
+                        except ValidationError as ve:
+                            self.decode_stats['invalid'] += 1
+                            logger.error(f"Invalid whale event: {ve}")
                         except Exception as e:
-                            logger.error(f"WebSocket message processing error: {e}")
+                            # Not tied to one message; reconnect with backoff rather than retrying in a tight loop
+                            logger.error(f"WebSocket message processing error ({feed.url}), reconnecting: {e}", exc_info=True)
+                            feed.stats['last_error'] = str(e)
+                            break
                             
             except Exception as e:
-                logger.error(f"WebSocket connection error: {e}")
+                logger.error(f"WebSocket connection error ({feed.url}): {e}")
+                feed.stats['last_error'] = str(e)
+            finally:
+                feed.ws = None
+
+            if feed.connected_at is not None:
+                connected_for = time.monotonic() - feed.connected_at
+                feed.stats['uptime'] += connected_for
+                feed.connected_at = None
+                if connected_for >= self.settings.WHALE_STABLE_SECONDS:
+                    attempt = 0
                 
-            # Retry connection if disconnected
-            if not self.bot.is_closed():
-                await asyncio.sleep(5)
-            else:
+            # Retry connection if disconnected; the other feeds keep running meanwhile
+            if self.bot.is_closed():
                 break
+            delay = self.reconnect_delay(attempt)
+            attempt += 1
+            feed.stats['reconnects'] += 1
+            logger.info(f"Reconnecting to {feed.url} in {delay:.1f}s (attempt {attempt})")
+            await asyncio.sleep(delay)
 
     @commands.Cog.listener()
     async def on_ready(self):
@@ -190,13 +915,210 @@ class WhaleMonitor(commands.Cog):
         if not self.cleanup_task:
             self.cleanup_task = self.bot.loop.create_task(self.cleanup_messages())
             logger.info("Whale Monitor: Started channel cleanup task")
+        if not self.sender_tasks:
+            self.sender_tasks = [
+                self.bot.loop.create_task(self.send_alerts())
+                for _ in range(max(1, self.settings.WHALE_SENDER_WORKERS))
+            ]
+            logger.info(f"Whale Monitor: Started {len(self.sender_tasks)} alert sender(s)")
+        if not self.dedup_task:
+            self.dedup_task = self.bot.loop.create_task(self.persist_dedup())
+        if not self.store_task:
+            self.store_task = self.bot.loop.create_task(self.persist_events())
+        if self.telegram and not self.telegram_tasks:
+            self.telegram_tasks = [
+                self.bot.loop.create_task(self.send_telegram_alerts(chat))
+                for chat in self.telegram.chats.values()
+            ]
+            logger.info("Whale Monitor: Mirroring alerts to Telegram")
 
-    def cog_unload(self):
+    async def cog_unload(self):
         """Cleanup when cog is unloaded"""
         if self._ws_task:
             self._ws_task.cancel()
         if self.cleanup_task:
             self.cleanup_task.cancel()
+        for task in self.sender_tasks:
+            task.cancel()
+        if self.burst_flush_task:
+            self.burst_flush_task.cancel()
+        if self.dedup_task:
+            self.dedup_task.cancel()
+        self.dedup.save()
+        self.ledger.close()
+        if self.store_task:
+            self.store_task.cancel()
+        if self.store_buffer:
+            self.event_store.insert_many(list(self.store_buffer))
+        self.event_store.close()
+        if self.webhook_session:
+            await self.webhook_session.close()
+        for task in self.telegram_tasks:
+            task.cancel()
+        if self.telegram:
+            await self.telegram.cleanup()
+
+    @commands.command(name='whale_metrics')
+    @commands.has_permissions(manage_channels=True)
+    async def whale_metrics(self, ctx):
+        """Show whale alert pipeline metrics"""
+        embed = discord.Embed(
+            title="🐋 Whale Alert Pipeline",
+            color=0x1DA1F2
+        )
+
+        stats = self.queue_stats
+        embed.add_field(
+            name="📥 Queue",
+            value=(
+                f"Depth: **{self.alert_queue.qsize()}** / {self.alert_queue.maxsize} (peak {stats['max_depth']})\n"
+                f"Enqueued: {stats['enqueued']:,} | Dropped: {stats['dropped']:,} | Sent: {stats['sent']:,}\n"
+                f"Overflow policy: `{self.settings.WHALE_OVERFLOW_POLICY}` | Workers: {len(self.sender_tasks)}"
+            ),
+            inline=False
+        )
+
+        embed.add_field(
+            name="🌊 Burst Aggregation",
+            value=(
+                f"Summaries: {stats['bursts']:,} covering {stats['aggregated']:,} alerts\n"
+                f"Window: {self.settings.WHALE_BURST_WINDOW:g}s | Threshold: {self.settings.WHALE_BURST_THRESHOLD} alerts"
+            ),
+            inline=False
+        )
+
+        for feed in self.feeds.values():
+            stream = feed.stats
+            connection = (
+                f"Status: {'🟢 Connected' if feed.connected_at is not None else '🔴 Disconnected'}\n"
+                f"Uptime: {feed.uptime() / 3600:.1f}h | Connects: {stream['connects']:,} | Reconnects: {stream['reconnects']:,}\n"
+                f"Replay requests: {stream['replays']:,} | Cursor: `{feed.cursor or 'none'}`\n"
+                f"Subscribe messages: {stream['subscriptions']:,}"
+            )
+            if stream['last_error']:
+                connection += f"\nLast error: {stream['last_error'][:200]}"
+            embed.add_field(name=f"🔌 {feed.url}"[:256], value=connection, inline=False)
+
+        embed.add_field(
+            name="🧲 Server Filter",
+            value=(
+                f"${self.routes.min_threshold or self.config.min_threshold:,}+ "
+                f"{', '.join(self.routes.tokens) or 'all tokens'}"
+                + (f" | Merging {len(self.feeds)} feeds, {len(self.merge_heap)} held for reordering" if len(self.feeds) > 1 else "")
+            ),
+            inline=False
+        )
+
+        decode = self.decode_stats
+        embed.add_field(
+            name="🧾 Decoding",
+            value=(
+                f"Received: {decode['received']:,} | Skipped early: {decode['skipped']:,}\n"
+                f"Fully decoded: {decode['decoded']:,} | Invalid: {decode['invalid']:,}\n"
+                f"Duplicates dropped: {self.dedup.hits:,} | Hashes tracked: {len(self.dedup):,}\n"
+                f"Stored: {self.store_stats['stored']:,} | Pending: {len(self.store_buffer):,} | "
+                f"Dropped from store buffer: {self.store_stats['dropped']:,}"
+            ),
+            inline=False
+        )
+
+        lag = self.alert_lag.summary()
+        embed.add_field(
+            name="⏱️ Receive → Post Lag",
+            value=f"Avg: {lag['avg']:.2f}s | p95: {lag['p95']:.2f}s | Max: {lag['max']:.2f}s",
+            inline=False
+        )
+
+        delivery = []
+        for mode, stats in self.delivery_latency.items():
+            latency = stats.summary()
+            if latency['count']:
+                delivery.append(
+                    f"{mode}: {latency['count']:,} sends | Avg: {latency['avg']:.2f}s | "
+                    f"p95: {latency['p95']:.2f}s | Max: {latency['max']:.2f}s"
+                )
+        embed.add_field(
+            name=f"📮 Delivery (mode: {self.settings.WHALE_DELIVERY_MODE})",
+            value="\n".join(delivery) or "No alerts sent yet",
+            inline=False
+        )
+
+        if self.telegram:
+            telegram = self.telegram_stats
+            embed.add_field(
+                name="✈️ Telegram Mirror",
+                value=(
+                    f"Pending: {sum(queue.qsize() for queue in self.telegram_queues.values())} "
+                    f"across {len(self.telegram_queues)} chat(s) | "
+                    f"Queued: {telegram['queued']:,} | Sent: {telegram['sent']:,}\n"
+                    f"Retries: {telegram['retries']:,} | Failed: {telegram['failed']:,} | "
+                    f"Dropped: {telegram['dropped']:,}"
+                ),
+                inline=False
+            )
+
+        await ctx.send(embed=embed, delete_after=30)
+
+    @commands.command(name='whale_stats')
+    async def whale_stats_command(self, ctx):
+        """Show whale buy volume for the last hour, day and week"""
+        embed = discord.Embed(
+            title="🐋 Whale Activity",
+            color=0x1DA1F2
+        )
+
+        for window in WINDOWS:
+            summary = self.whale_stats.summary(window)
+            value = (
+                f"Buys: **{summary['count']:,}** | Volume: **${summary['sum']:,.2f}**\n"
+                f"Largest: ${summary['max']:,.2f}"
+            )
+            if summary['top']:
+                value += "\n" + "\n".join(
+                    f"{rank}. ${amount:,.2f} — [tx](https://solscan.io/tx/{tx_hash})"
+                    for rank, (amount, tx_hash) in enumerate(summary['top'][:3], start=1)
+                )
+            embed.add_field(name=f"📊 Last {window}", value=value, inline=False)
+
+        embed.set_footer(text="Buys above the lowest alert threshold since the bot started")
+        await ctx.send(embed=embed, delete_after=60)
+
+    @commands.command(name='whale_search')
+    async def whale_search(self, ctx, *, filters: str = ""):
+        """Search stored whale buys
+
+        Usage: !whale_search [min:<usd>] [max:<usd>] [hours:<n>|days:<n>] [wallet:<address>] [token:<symbol>]
+        Example: !whale_search min:20000 days:7"""
+        query = WhaleQuery()
+        now = datetime.now(timezone.utc)
+
+        for pair in filters.split():
+            if ':' not in pair:
+                continue
+
+            key, value = pair.split(':', 1)
+            key = key.lower()
+
+            try:
+                if key == 'min':
+                    query.min_amount = float(value)
+                elif key == 'max':
+                    query.max_amount = float(value)
+                elif key == 'hours':
+                    query.since = (now - timedelta(hours=float(value))).timestamp()
+                elif key == 'days':
+                    query.since = (now - timedelta(days=float(value))).timestamp()
+                elif key == 'wallet':
+                    query.wallet = value
+                elif key == 'token':
+                    query.token = value.upper()
+            except ValueError:
+                await ctx.send(f"❌ Invalid value for `{key}`", delete_after=10)
+                return
+
+        total, volume = await asyncio.to_thread(self.event_store.count, query)
+        view = WhaleSearchView(self, ctx.author.id, query, total, volume)
+        await ctx.send(embed=await view.render(), view=view, delete_after=180)
 
     @commands.command(name='set_whale_channel')
     @commands.has_permissions(administrator=True)
@@ -216,6 +1138,8 @@ class WhaleMonitor(commands.Cog):
             
             self.config.channel_id = channel_id
             self.config.save()
+            self.rebuild_routes()
+            await self.update_subscription()
             
             await ctx.send(
                 f"✅ Channel ID {channel_id} has been set for whale alerts.\n"
@@ -247,6 +1171,8 @@ class WhaleMonitor(commands.Cog):
             
         self.config.min_threshold = amount
         self.config.save()
+        self.rebuild_routes()
+        await self.update_subscription()
         
         await ctx.send(
             f"✅ Whale alert minimum set to ${amount:,}\n"
@@ -254,6 +1180,52 @@ class WhaleMonitor(commands.Cog):
             delete_after=30
         )
 
+    @commands.command(name='add_whale_subscription')
+    @commands.has_permissions(administrator=True)
+    async def add_whale_subscription(self, ctx, channel_id: int, amount: int, *tokens: str):
+        """Send whale alerts above a threshold to an extra channel
+
+        Usage: !add_whale_subscription <channel_id> <amount> [tokens...]
+        Example: !add_whale_subscription 123456789 50000 TETSUO"""
+        channel = self.bot.get_channel(channel_id)
+        if not channel or not isinstance(channel, discord.TextChannel):
+            await ctx.send("❌ Could not find a text channel with that ID", delete_after=10)
+            return
+
+        if amount < 1000 or amount > 1000000:
+            await ctx.send("❌ Minimum value must be between $1,000 and $1,000,000", delete_after=10)
+            return
+
+        subscription = AlertSubscription(channel_id=channel_id, min_threshold=amount, tokens=list(tokens))
+        # One subscription per channel; re-adding replaces it
+        self.config.subscriptions = [
+            existing for existing in self.config.subscriptions if existing.channel_id != channel_id
+        ] + [subscription]
+        self.config.save()
+        self.rebuild_routes()
+        await self.update_subscription()
+
+        await ctx.send(
+            f"✅ <#{channel_id}> will receive buys above ${amount:,}"
+            + (f" for {', '.join(subscription.tokens)}" if subscription.tokens else ""),
+            delete_after=30
+        )
+
+    @commands.command(name='remove_whale_subscription')
+    @commands.has_permissions(administrator=True)
+    async def remove_whale_subscription(self, ctx, channel_id: int):
+        """Stop sending whale alerts to an extra channel"""
+        remaining = [existing for existing in self.config.subscriptions if existing.channel_id != channel_id]
+        if len(remaining) == len(self.config.subscriptions):
+            await ctx.send("❌ No subscription for that channel", delete_after=10)
+            return
+
+        self.config.subscriptions = remaining
+        self.config.save()
+        self.rebuild_routes()
+        await self.update_subscription()
+        await ctx.send(f"✅ Removed whale alert subscription for <#{channel_id}>", delete_after=30)
+
     @commands.command(name='whale_channel')
     @commands.has_permissions(manage_channels=True)
     async def whale_channel(self, ctx):
@@ -297,6 +1269,17 @@ class WhaleMonitor(commands.Cog):
             value="✅ Alerts are enabled" if self.config.notifications_enabled else "⛔ Alerts are disabled",
             inline=False
         )
+
+        if self.config.subscriptions:
+            embed.add_field(
+                name="Extra Subscriptions",
+                value="\n".join(
+                    f"<#{subscription.channel_id}>: ${subscription.min_threshold:,}+"
+                    + (f" ({', '.join(subscription.tokens)})" if subscription.tokens else "")
+                    for subscription in sorted(self.config.subscriptions, key=lambda item: item.min_threshold)
+                ),
+                inline=False
+            )
         
         if ctx.channel.id == self.config.channel_id:
             embed.add_field(
@@ -112,17 +112,13 @@ async def main():
         await bot.load_extension('cogs.twitter_raid')
         logger.info("Twitter raid loaded successfully!")
         
-        logger.info("Loading CMC raid extension...")
-        await bot.load_extension('cogs.cmc_raid')
-        logger.info("CMC raid loaded successfully!")
+        logger.info("Loading Metric raid extension...")
+        await bot.load_extension('cogs.metric_raid')
+        logger.info("Metric raid loaded successfully!")
 
-        logger.info("Loading Gecko raid extension...")
-        await bot.load_extension('cogs.gecko_raid')
-        logger.info("Gecko raid loaded successfully!")
-
-        logger.info("Loading Dextools raid extension...")
-        await bot.load_extension('cogs.dextools_raid')
-        logger.info("Dextools raid loaded successfully!")
+        logger.info("Loading Composite raid extension...")
+        await bot.load_extension('cogs.composite_raid')
+        logger.info("Composite raid loaded successfully!")
 
         logger.info("Loading Whale Watcher extension...")
         await bot.load_extension('cogs.whale_watcher')